@@ -5,6 +5,11 @@ from dataclasses import dataclass
 from typing import Dict, Tuple, Optional
 import numpy as np
 
+try:
+    from numba import njit  # type: ignore  # optional JIT for the temperature scan
+except Exception:  # pragma: no cover
+    njit = None
+
 
 # -------------------------
 # Thermal (room) parameters
@@ -280,6 +285,74 @@ def step_temp(
     return T_next_c, info
 
 
+def _temp_scan_loop(Tin0, Tout, k, U, q_heat, lo, hi, out):
+    """Clipped first-order recurrence, same operation order as `_thermal_step`."""
+    Tin = Tin0
+    for i in range(Tout.shape[0]):
+        Tin = Tin + k * (U * (Tout[i] - Tin) + q_heat[i])
+        if Tin < lo:
+            Tin = lo
+        elif Tin > hi:
+            Tin = hi
+        out[i] = Tin
+    return out
+
+
+def _temp_scan_py(Tin0, Tout, k, U, q_heat, lo, hi, out):
+    # Same loop on Python floats; indexing NumPy scalars would be slower still.
+    Tin = Tin0
+    vals = []
+    for To, q in zip(Tout.tolist(), q_heat.tolist()):
+        Tin = min(max(Tin + k * (U * (To - Tin) + q), lo), hi)
+        vals.append(Tin)
+    out[:] = vals
+    return out
+
+
+# Compiled when numba is installed (no fastmath: results must match step_temp).
+_temp_scan = njit(cache=True)(_temp_scan_loop) if njit is not None else _temp_scan_py
+
+
+def rollout_temp(
+    T_in0_c: float,
+    T_out_c: np.ndarray,
+    action_frac: float | np.ndarray,
+    params: ThermalParams,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Horizon version of `step_temp` for an open-loop action: one fraction for
+    every step or one per step (same length as T_out_c).
+
+    Returns (Tin_next, info) where Tin_next[k] is the temperature after step k
+    and info holds the `step_temp` keys as float64 arrays. Only the clipped
+    temperature recurrence is sequential; everything else is elementwise.
+    """
+    Tout = np.ascontiguousarray(T_out_c, dtype=np.float64)
+    n = Tout.shape[0]
+    a = np.broadcast_to(np.clip(np.asarray(action_frac, dtype=np.float64), 0.0, 1.0), (n,))
+    # The heater terms are linear in the action, so all steps go in one pass.
+    q_heat_kw = params.heater_eff * params.heater_pmax_kw * a
+    elec_power_kw = params.heater_pmax_kw * a
+    k = params.dt_h / params.C_th_kwh_per_degC
+    lo, hi = float(params.clip_temp_c[0]), float(params.clip_temp_c[1])
+
+    Tin_next = _temp_scan(float(T_in0_c), Tout, k, params.U_kw_per_degC, q_heat_kw,
+                          lo, hi, np.empty(n, dtype=np.float64))
+    Tin_prev = np.empty_like(Tin_next)
+    Tin_prev[:1] = float(T_in0_c)
+    Tin_prev[1:] = Tin_next[:-1]
+
+    q_loss_kw = params.U_kw_per_degC * (Tout - Tin_prev)
+    info = {
+        "q_loss_kw": q_loss_kw,
+        "q_heat_kw": q_heat_kw,
+        "dT": k * (q_loss_kw + q_heat_kw),
+        "elec_power_kw": elec_power_kw,
+        "elec_energy_kwh": elec_power_kw * params.dt_h,
+    }
+    return Tin_next, info
+
+
 def steady_state_temp(T_out_c: float, q_heat_kw: float, params: ThermalParams) -> float:
     """T* for constant Tout and thermal input q_heat_kw."""
     if params.U_kw_per_degC <= 0:
@@ -297,5 +370,6 @@ __all__ = [
     "Ports",
     "plant_step_multi",
     "step_temp",            # legacy
+    "rollout_temp",
     "steady_state_temp",
 ]
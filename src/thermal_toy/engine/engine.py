@@ -3,7 +3,7 @@ from typing import Tuple, Optional
 import math
 
 from ..io import build_scenario, load_config_yaml
-from ..reward import step_reward, comfort_band
+from ..reward import step_reward, comfort_band, warmup as warmup_reward
 from .types import Action, GameState, Obs, TickInfo
 
 class Engine:
@@ -25,6 +25,7 @@ class Engine:
         )
         cfg = load_config_yaml(config_yaml_path)
         ov = overrides or {}
+        warmup_reward()   # JIT the reward kernel here, not on the first step
 
         # HVAC sizing and COPs (fallbacks keep you running)
         self.q_heat_max_kw = float(ov.get("hp_q_heat_max_kw_th",
@@ -40,6 +41,14 @@ class Engine:
             float(self.scenario.T_set_c), float(self.scenario.comfort_width_c)
         )
 
+        # Per-step constants, unboxed once (scenario/params are frozen)
+        self.dt_h = float(self.scenario.dt_h)
+        self._T_set_c = float(self.scenario.T_set_c)
+        self._comfort_width_c = float(self.scenario.comfort_width_c)
+        self._C_th = max(float(self.th_params.C_th_kwh_per_degC), 1e-9)
+        self._U_th = float(self.th_params.U_kw_per_degC)
+        self._clip_lo, self._clip_hi = (float(x) for x in self.th_params.clip_temp_c)
+
         self._state = GameState(
             k=0,
             Tin_c=float(self.scenario.T_in0_c),
@@ -67,7 +76,7 @@ class Engine:
         terminated = False
 
         # Exogenous at k
-        dt = float(self.scenario.dt_h)
+        dt = self.dt_h
         Tout = float(self.scenario.t_out_c[k])
         price = float(self.scenario.price_eur_per_kwh[k])
 
@@ -81,21 +90,18 @@ class Engine:
             elec_power_kw = (-q_hvac_kw) / max(self.cop_cool, 1e-6)
 
         # Thermal balance
-        C = float(self.th_params.C_th_kwh_per_degC)
-        U = float(self.th_params.U_kw_per_degC)
         Tin = float(self._state.Tin_c)
-        q_loss_kw = U * (Tout - Tin)
-        dT = (dt / max(C, 1e-9)) * (q_loss_kw + q_hvac_kw)
+        q_loss_kw = self._U_th * (Tout - Tin)
+        dT = (dt / self._C_th) * (q_loss_kw + q_hvac_kw)
         Tin_next = float(Tin + dT)
-        lo, hi = self.th_params.clip_temp_c
-        Tin_next = float(min(hi, max(lo, Tin_next)))
+        Tin_next = float(min(self._clip_hi, max(self._clip_lo, Tin_next)))
 
         # Energy cost & reward
         elec_energy_kwh = elec_power_kw * dt
         r, info_r = step_reward(
             t_in_c=Tin_next,
-            t_set_c=float(self.scenario.T_set_c),
-            comfort_width_c=float(self.scenario.comfort_width_c),
+            t_set_c=self._T_set_c,
+            comfort_width_c=self._comfort_width_c,
             price_eur_per_kwh=price,
             elec_energy_kwh=elec_energy_kwh,
             params=self.rw_params,
@@ -133,7 +139,7 @@ class Engine:
     # ---- helpers ----
     def _build_obs(self) -> Obs:
         k = self._state.k
-        dt = float(self.scenario.dt_h)
+        dt = self.dt_h
         hour = (k * dt) % 24.0
         return Obs(
             Tin_c=float(self._state.Tin_c),
@@ -2,8 +2,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class Action:
+    # Mutable on purpose: GameSession refills one instance per tick.
     hvac_u: float = 0.0  # [-1, +1] cooling/heating
 
 @dataclass
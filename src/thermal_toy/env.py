@@ -19,7 +19,7 @@ from .dynamics import (
     Ports,
     plant_step_multi,
 )
-from .reward import RewardParams, step_reward, comfort_band
+from .reward import RewardParams, step_reward, comfort_band, warmup as warmup_reward
 from .devices import make_devices
 from .devices.resistive import ResistiveHeater
 from .devices.heat_pump_bidir import BiDirectionalHeatPump
@@ -66,6 +66,7 @@ class ThermalPlantEnv(gym.Env):
         self.scenario, self.th_params, self.rw_params = build_scenario(
             env_cfg.config_yaml_path, env_cfg.day_csv_path, enforce_horizon=True
         )
+        warmup_reward()   # JIT the reward kernel here, not on the first step
 
         # Devices
         self.devices = make_devices(env_cfg.devices)
@@ -1,8 +1,9 @@
 from __future__ import annotations
+import threading
 from pathlib import Path
 from functools import lru_cache
 from typing import Tuple, Optional
-from PIL import Image, ImageTk
+from PIL import Image, ImageFont, ImageTk
 
 def _candidate_dirs() -> list[Path]:
     """Search order for assets/images directory."""
@@ -15,8 +16,8 @@ def _candidate_dirs() -> list[Path]:
     return [p for p in candidates if p.exists()]
 
 @lru_cache(maxsize=128)
-def load_sprite(name: str, size: Tuple[int, int] | None = None) -> ImageTk.PhotoImage:
-    """Load PNG by stem; optional resize to `size`."""
+def _load_sprite_image(name: str, size: Tuple[int, int] | None = None) -> Image.Image:
+    """Decode (and resize) a PNG once per (name, size); shared, treat as read-only."""
     stem = name if name.lower().endswith(".png") else f"{name}.png"
     path: Optional[Path] = None
     for base in _candidate_dirs():
@@ -27,5 +28,27 @@ def load_sprite(name: str, size: Tuple[int, int] | None = None) -> ImageTk.Photo
     img = Image.open(path).convert("RGBA") if path else Image.new("RGBA", (size or (160, 90)), (64, 64, 64, 255))
     if size is not None:
         img = img.resize(size, Image.LANCZOS)
-    return ImageTk.PhotoImage(img)
+    return img
+
+def load_sprite(name: str, size: Tuple[int, int] | None = None) -> ImageTk.PhotoImage:
+    """Load PNG by stem; optional resize to `size`."""
+    # Only the PIL stage is cached: PhotoImages belong to one Tk interpreter
+    # and would outlive it (and leak) in a module-level cache.
+    return ImageTk.PhotoImage(_load_sprite_image(name, None if size is None else tuple(size)))
+
+def load_font(size: int, names: Tuple[str, ...]) -> ImageFont.ImageFont:
+    """First of `names` that loads as a TrueType font at `size`, else PIL's default."""
+    # Probe + TTF parse happen once per (size, names) *per thread*: sprites and
+    # charts render on worker threads as well as the Tk thread, and FreeType
+    # faces are not safe to share between concurrent renders.
+    return _load_font(int(size), tuple(names), threading.get_ident())
 
+@lru_cache(maxsize=64)
+def _load_font(size: int, names: Tuple[str, ...], _thread_id: int) -> ImageFont.ImageFont:
+    for name in names:
+        for cand in (name, f"{name}.ttf"):
+            try:
+                return ImageFont.truetype(cand, size)
+            except Exception:
+                pass
+    return ImageFont.load_default()
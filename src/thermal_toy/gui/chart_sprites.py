@@ -5,15 +5,13 @@ from typing import Sequence, Tuple, Optional, List
 
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 
+from .assets import load_font
+
 # ------- text + styling helpers -------
+_FONTS = ("Segoe UI", "Arial", "DejaVuSans")
+
 def _font(size: int = 12):
-    for name in ("Segoe UI", "Arial", "DejaVuSans"):
-        for cand in (name, name + ".ttf"):
-            try:
-                return ImageFont.truetype(cand, size)
-            except Exception:
-                pass
-    return ImageFont.load_default()
+    return load_font(size, _FONTS)
 
 def _text_size(d: ImageDraw.ImageDraw, s: str, f) -> Tuple[int, int]:
     try:
@@ -100,7 +98,9 @@ def _ticks_lin(lo: float, hi: float, step: float) -> List[float]:
 
 
 # ------- chart sprite generators -------
-def make_temp_chart_sprite(
+# render_* return a PIL image and are safe to call off the Tk thread;
+# make_*_sprite wrap them in a Tk PhotoImage (Tk thread only).
+def render_temp_chart(
     hours: Sequence[float],
     tin_hist: Sequence[float],
     comfort_L: float,
@@ -113,7 +113,7 @@ def make_temp_chart_sprite(
     panel_fill=(255, 255, 255, 255),        # NEW
     panel_outline=None,                     # NEW (set to (210,210,210,255) if you want it)
     draw_axes_frame=False                   # NEW
-) -> ImageTk.PhotoImage:
+) -> Image.Image:
     W, H = size
     im = Image.new("RGBA", (W, H), panel_fill)
     d = ImageDraw.Draw(im)
@@ -128,8 +128,8 @@ def make_temp_chart_sprite(
     L, T, R, B = PL + mL, PT + mT, PR - mR, PB - mB
     Li, Ti, Ri, Bi = L + 1, T + 1, R - 1, B - 1
 
-    if not hours:
-        return ImageTk.PhotoImage(im)
+    if len(hours) == 0:
+        return im
 
     xmin, xmax = float(hours[0]), float(hours[-1])
     xt = _ticks_lin(0.0, 24.0, 4.0) if (xmax - xmin) >= 12 else _ticks_lin(xmin, xmax, max(1.0, (xmax - xmin) / 6))
@@ -146,7 +146,7 @@ def make_temp_chart_sprite(
     d.line([(Li, yU), (Ri, yU)], fill=(80, 160, 80, 180), width=1)
 
     # Tin line
-    if tin_hist:
+    if len(tin_hist):
         xs = [_xmap(h, xmin, xmax, Li, Ri) for h in hours[:len(tin_hist)]]
         ys = [_ymap(v, ymin, ymax, Ti, Bi) for v in tin_hist]
         for i in range(1, len(xs)):
@@ -162,10 +162,14 @@ def make_temp_chart_sprite(
         cx = _xmap(cursor_hour, xmin, xmax, Li, Ri)
         d.line([(cx, Ti), (cx, Bi)], fill=(0, 0, 0, 140), width=1)
 
-    return ImageTk.PhotoImage(im)
+    return im
+
+
+def make_temp_chart_sprite(*args, **kwargs) -> ImageTk.PhotoImage:
+    return ImageTk.PhotoImage(render_temp_chart(*args, **kwargs))
 
 
-def make_price_chart_sprite(
+def render_price_chart(
     hours: Sequence[float],
     price: Sequence[float],
     *,
@@ -173,7 +177,7 @@ def make_price_chart_sprite(
     cursor_hour: Optional[float] = None,
     margins: Tuple[int, int, int, int] = (16, 10, 16, 16),
     outer_pad: Tuple[int, int, int, int] = (8, 8, 8, 8),
-) -> ImageTk.PhotoImage:
+) -> Image.Image:
     W, H = size
     im = Image.new("RGBA", (W, H), (255, 255, 255, 255))
     d = ImageDraw.Draw(im)
@@ -186,8 +190,8 @@ def make_price_chart_sprite(
     L, T, R, B = PL + mL, PT + mT, PR - mR, PB - mB
     Li, Ti, Ri, Bi = L + 1, T + 1, R - 1, B - 1
 
-    if not hours:
-        return ImageTk.PhotoImage(im)
+    if len(hours) == 0:
+        return im
 
     xmin, xmax = float(hours[0]), float(hours[-1])
     ymin, ymax = _auto_minmax(price, pad_ratio=0.12, fallback=(0.0, 1.0))
@@ -196,7 +200,7 @@ def make_price_chart_sprite(
     p_step = round(p_step / 0.05) * 0.05
     yt = _ticks_lin(math.floor(ymin / p_step) * p_step, math.ceil(ymax / p_step) * p_step, p_step)
 
-    if price:
+    if len(price):
         xs = [_xmap(h, xmin, xmax, Li, Ri) for h in hours]
         ys = [_ymap(v, ymin, ymax, Ti, Bi) for v in price]
         for i in range(1, len(xs)):
@@ -211,9 +215,14 @@ def make_price_chart_sprite(
         cx = _xmap(cursor_hour, xmin, xmax, Li, Ri)
         d.line([(cx, Ti), (cx, Bi)], fill=(0, 0, 0, 160), width=1)
 
-    return ImageTk.PhotoImage(im)
+    return im
 
-def make_weather_pv_chart_sprite(
+
+def make_price_chart_sprite(*args, **kwargs) -> ImageTk.PhotoImage:
+    return ImageTk.PhotoImage(render_price_chart(*args, **kwargs))
+
+
+def render_weather_pv_chart(
     hours: Sequence[float],
     tout: Sequence[float],
     pv: Sequence[float],
@@ -222,7 +231,7 @@ def make_weather_pv_chart_sprite(
     cursor_hour: Optional[float] = None,
     margins: Tuple[int, int, int, int] = (16, 12, 36, 16),  # extra right for PV ticks
     outer_pad: Tuple[int, int, int, int] = (8, 8, 8, 8),
-) -> ImageTk.PhotoImage:
+) -> Image.Image:
     W, H = size
     im = Image.new("RGBA", (W, H), (255, 255, 255, 255))
     d = ImageDraw.Draw(im)
@@ -235,8 +244,8 @@ def make_weather_pv_chart_sprite(
     L, T, R, B = PL + mL, PT + mT, PR - mR, PB - mB
     Li, Ti, Ri, Bi = L + 1, T + 1, R - 1, B - 1
 
-    if not hours:
-        return ImageTk.PhotoImage(im)
+    if len(hours) == 0:
+        return im
 
     xmin, xmax = float(hours[0]), float(hours[-1])
 
@@ -289,5 +298,8 @@ def make_weather_pv_chart_sprite(
         cx = _xmap(cursor_hour, xmin, xmax, Li, Ri)
         d.line([(cx, Ti), (cx, Bi)], fill=(0, 0, 0, 160), width=1)
 
-    return ImageTk.PhotoImage(im)
+    return im
+
 
+def make_weather_pv_chart_sprite(*args, **kwargs) -> ImageTk.PhotoImage:
+    return ImageTk.PhotoImage(render_weather_pv_chart(*args, **kwargs))
@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 import os
 import tkinter as tk
+from functools import lru_cache
 from typing import Tuple, Optional
 
 from PIL import Image, ImageDraw, ImageTk, ImageFont, ImageFilter, ImageOps
@@ -26,6 +27,21 @@ def _load_house_original() -> Image.Image:
     return _loaded_house
 
 
+@lru_cache(maxsize=8)
+def _load_house_base(size: Tuple[int, int]) -> Image.Image:
+    """house.png fitted inside `size` (aspect kept); resampled once per size."""
+    src = _load_house_original()
+    W0, H0 = src.size
+    scale = min(size[0] / W0, size[1] / H0)
+    fit = (max(1, round(W0 * scale)), max(1, round(H0 * scale)))
+    # Box-average by the integer part of the ratio first, so LANCZOS only
+    # covers the remaining < 2x step (e.g. 1024 -> 341 -> 280).
+    fx, fy = W0 // fit[0], H0 // fit[1]
+    if min(fx, fy) >= 2:
+        src = src.reduce((fx, fy))
+    return src.resize(fit, Image.LANCZOS)
+
+
 # -----------------------------------------------------------------------------
 # Font helpers (used only in demo’s time badge; safe to keep)
 # -----------------------------------------------------------------------------
@@ -132,8 +148,40 @@ def render_house_png(
     If `size` is provided, the result is rendered at the original resolution and then
     downscaled ONCE to FIT INSIDE the given box (preserving aspect). The sky fills
     the full canvas; the house is centered (letterboxed) on the sky.
+
+    Results are memoized per (time_minute, size, flags) and shared between callers:
+    `.copy()` before drawing on the returned image.
     """
-    base_house = _load_house_original()  # original RGBA
+    # Normalise here so list sizes still work and hit the same cache keys.
+    return _render_house_cached(
+        int(time_minute), tuple(size) if size else None,
+        bool(with_sky), bool(show_time), bool(sharpen),
+    )
+
+
+# One full day at 15-min steps; reserve_house_frames() grows it for finer steps.
+_HOUSE_CACHE_MIN = 96
+
+
+def reserve_house_frames(n: int) -> None:
+    """Make the frame cache hold at least `n` frames (the prewarm calls this)."""
+    global _render_house_cached
+    if n > _render_house_cached.cache_info().maxsize:
+        # Rebinding drops the old entries; it happens before the prewarm fills it.
+        _render_house_cached = lru_cache(maxsize=n)(_render_house)
+
+
+def _render_house(
+    time_minute: int,
+    size: Optional[Tuple[int, int]],
+    with_sky: bool,
+    show_time: bool,
+    sharpen: bool,
+) -> Image.Image:
+    # Without the demo badge (sized for the full-res canvas) nothing here depends
+    # on resolution, so compose directly on the house pre-fitted to the box.
+    prefit = bool(size) and not show_time
+    base_house = _load_house_base(tuple(size)) if prefit else _load_house_original()
     W0, H0 = base_house.size
 
     # Compose at original resolution
@@ -190,7 +238,7 @@ def render_house_png(
 
     # Fit to target box (preserve aspect)
     TW, TH = size
-    fitted = ImageOps.contain(canvas, (TW, TH), method=Image.LANCZOS)
+    fitted = canvas if prefit else ImageOps.contain(canvas, (TW, TH), method=Image.LANCZOS)
 
     if sharpen:
         fitted = fitted.filter(ImageFilter.UnsharpMask(radius=1.0, percent=60, threshold=2))
@@ -202,6 +250,9 @@ def render_house_png(
     return out
 
 
+_render_house_cached = lru_cache(maxsize=_HOUSE_CACHE_MIN)(_render_house)
+
+
 # -----------------------------------------------------------------------------
 # Tk demo (cycles through day → night)
 # -----------------------------------------------------------------------------
@@ -6,18 +6,16 @@ from typing import Sequence, Tuple, Optional, List
 
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 
+from .assets import load_font
+
 
 # =========================
 # text + styling helpers
 # =========================
+_FONTS = ("Segoe UI", "Arial", "DejaVuSans")
+
 def _font(size: int = 12):
-    for name in ("Segoe UI", "Arial", "DejaVuSans"):
-        for cand in (name, name + ".ttf"):
-            try:
-                return ImageFont.truetype(cand, size)
-            except Exception:
-                pass
-    return ImageFont.load_default()
+    return load_font(size, _FONTS)
 
 
 def _text_size(d: ImageDraw.ImageDraw, s: str, f) -> Tuple[int, int]:
@@ -150,7 +148,7 @@ def make_energy_breakdown_sprite(
     L, T, R, B = PL + mL, PT + mT, PR - mR, PB - mB
     Li, Ti, Ri, Bi = L + 1, T + 1, R - 1, B - 1
 
-    if not hours:
+    if len(hours) == 0:
         return ImageTk.PhotoImage(im)
 
     xmin, xmax = float(hours[0]), float(hours[-1])
@@ -263,7 +261,7 @@ def make_actions_sprite(
     L, T, R, B = PL + mL, PT + mT, PR - mR, PB - mB
     Li, Ti, Ri, Bi = L + 1, T + 1, R - 1, B - 1
 
-    if not hours:
+    if len(hours) == 0:
         return ImageTk.PhotoImage(im)
 
     xmin, xmax = float(hours[0]), float(hours[-1])
@@ -305,7 +303,7 @@ def _area(d: ImageDraw.ImageDraw, xs, ys, base_y: int, *, fill):
     Filled area between the polyline (xs, ys) and a horizontal baseline
     at screen y = base_y.  Coordinates must be integers for PIL.
     """
-    if not xs or not ys:
+    if len(xs) == 0 or len(ys) == 0:
         return
     n = min(len(xs), len(ys))
     bx = int(xs[0])
@@ -343,7 +341,7 @@ def make_rewards_sprite(
     L, T, R, B = PL + mL, PT + mT, PR - mR, PB - mB
     Li, Ti, Ri, Bi = L + 1, T + 1, R - 1, B - 1
 
-    if not hours:
+    if len(hours) == 0:
         return ImageTk.PhotoImage(im)
 
     xmin, xmax = float(hours[0]), float(hours[-1])
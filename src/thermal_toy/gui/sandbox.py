@@ -1,19 +1,33 @@
 from __future__ import annotations
 
-import math
+import logging
+import os
+import statistics
+import threading
+import time
 import tkinter as tk
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from tkinter import ttk, messagebox
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from PIL import ImageTk
 
+from ..io import _DAY_CSV_DTYPES as _IO_DAY_CSV_DTYPES
 from ..runtime import GameSession
-from .sprite_factory import sprite_hvac, sprite_pv, sprite_battery, sprite_house_from_png
+from .sprite_factory import (
+    render_hvac, render_pv, render_battery, render_house_from_png, prewarm_house_frames,
+)
 
 from .chart_sprites import (
-    make_temp_chart_sprite,
-    make_price_chart_sprite,
-    make_weather_pv_chart_sprite,
+    render_temp_chart,
+    render_price_chart,
+    render_weather_pv_chart,
 )
 
 from .output_splines import (
@@ -24,12 +38,53 @@ from .output_splines import (
 HVAC_MAX_KW = 5.0      # fallback scale for hvac power if runtime doesn’t provide it
 BATTERY_MAX_KW = 3.0   # fallback scale for battery power
 PV_KWP = 1.0           # if your pv series is “per kWp”, multiply by plant size here
+REFRESH_DEBOUNCE_MS = 30  # coalesce slider drags / resizes into one redraw per window
+STALL_PAUSE_S = 1.5       # auto-pause Play if a single step takes longer than this
+CHART_POLL_MS = 10        # how often the Tk thread checks for finished chart renders
+
+# Columns _load_day reads (optional ones may be absent) and their parse dtypes.
+# dt_h stays float64: it drives step/hour arithmetic.
+_DAY_CSV_DTYPES = {
+    **_IO_DAY_CSV_DTYPES,   # t / dt_h / t_out_c / price: same parse as thermal_toy.io
+    "day": "int32",
+    "hour_of_day": "float32",
+    "solar_gen_kw_per_kwp": "float32",
+}
+
+def _decimate_idx(n: int, target: int) -> Optional[np.ndarray]:
+    """
+    Evenly spaced indices (first and last kept, so the x-domain and cursor stay
+    put) when a series has over 2 points per pixel; None = draw everything.
+    """
+    if target <= 0 or n <= 2 * target:
+        return None
+    return np.linspace(0, n - 1, target).astype(np.intp)
+
+# Sprite name per whole hour (all boundaries fall on the hour).
+_TOD_SPRITES = tuple(
+    "house_morning" if 6 <= h < 11 else
+    "house_midday" if 11 <= h < 16 else
+    "house_afternoon" if 16 <= h < 21 else
+    "house_night"
+    for h in range(24)
+)
 
 def time_of_day_sprite(hour: float) -> str:
-    if 6 <= hour < 11:  return "house_morning"
-    if 11 <= hour < 16: return "house_midday"
-    if 16 <= hour < 21: return "house_afternoon"
-    return "house_night"
+    return _TOD_SPRITES[int(hour) % 24]
+
+
+@dataclass(frozen=True)
+class _DayWindow:
+    """Static series for one chart window (today + optional lookahead), sliced once."""
+    k0: int
+    k1: int
+    win_start: float          # absolute hour of the window origin
+    hours_rel: np.ndarray     # hours relative to win_start
+    price: np.ndarray
+    tout: np.ndarray
+    pv: np.ndarray
+    people_kw: np.ndarray
+    pv_kw: np.ndarray         # pv * PV_KWP
 
 
 class SandboxWindow(tk.Toplevel):
@@ -59,10 +114,12 @@ class SandboxWindow(tk.Toplevel):
         # consistent quadrant sizes (no scrolling)
         self.COL_W = 470       # quadrant width
         self.HOUSE_SIZE = (self.COL_W, 280)
+        self.BADGE_SIZE = (220, 220)
         self.CHART_W = self.COL_W
         self.CH_H_TEMP = 180
         self.CH_H_PRICE = 150
         self.CH_H_WEATHER = 180
+        self.CH_H_OUT = 180    # each Outputs panel (HVAC / PV / battery)
 
         # ---- engine/session ----
         self.session = session or GameSession(day_csv_path=self.csv_path)
@@ -73,13 +130,15 @@ class SandboxWindow(tk.Toplevel):
         self.dt_h   = self.dt
 
         # weather/price axes
-        self.hours    = self.df_day["hour_of_day"].to_numpy()
+        # One contiguous float32 array per series (a view when the loader's
+        # dtypes already match); day windows slice these without copying.
+        self.hours    = self._f32(self.df_day["hour_of_day"])
         self.days_col = self.df_day["day"].to_numpy()
-        self.x_abs_h  = (self.hours + 24.0 * (self.days_col - 1)).astype(float)
+        self.x_abs_h  = self.hours + np.float32(24.0) * (self.days_col - 1).astype(np.float32)
 
-        self.price = self.df_day["price_eur_per_kwh"].to_numpy()
-        self.tout  = self.df_day["t_out_c"].to_numpy()
-        self.pv    = self.df_day["solar_gen_kw_per_kwp"].to_numpy()
+        self.price = self._f32(self.df_day["price_eur_per_kwh"])
+        self.tout  = self._f32(self.df_day["t_out_c"])
+        self.pv    = self._f32(self.df_day["solar_gen_kw_per_kwp"])
 
         self.steps_per_day   = int(round(24.0 / self.dt))
         self.total_steps_csv = int(len(self.df_day))
@@ -87,10 +146,11 @@ class SandboxWindow(tk.Toplevel):
 
         # ---- people/base-load profile ----
         self.df_profile = self._load_profile("data/profile.csv")
-        self.people_kw  = self._align_profile_to_main(self.df_profile, self.dt, self.total_steps_csv)
+        self.people_kw  = self._f32(self._align_profile_to_main(self.df_profile, self.dt, self.total_steps_csv))
+        self._day_windows = self._build_day_windows()
 
         # ---- state & histories ----
-        self._tin_hist: list[float] = []
+        self._tin_arr = np.full(self.T, np.nan, dtype=np.float32)   # Tin after step k at [k]; first _k valid
         self._u_hvac_hist: list[float] = []
         self._u_batt_hist: list[float] = []
         self._hvac_kw_hist: list[float] = []
@@ -100,10 +160,30 @@ class SandboxWindow(tk.Toplevel):
 
         self._k: int = 0
         self._last_info: dict = {}
+        self._act_dict: dict = {"u": 0.0}   # reused per step; sessions only read it
         self.playing = False
+        self._play_t0: float = 0.0        # monotonic time / step index Play started from
+        self._play_step0: int = 0
+        self._loop_id: Optional[str] = None       # pending _loop callback
+        self._visible = True                      # False while iconified/unmapped
+        self._badge_key: Optional[tuple] = None   # last quantized (u, pv, soc) drawn
+        self._pasted: dict[str, object] = {}      # PIL image last pasted per label
+        self._badges_after_id: Optional[str] = None
+        self._charts_after_id: Optional[str] = None
+        self._chart_keys: dict[str, tuple] = {}     # last drawn fingerprint per chart
+
+        # Charts render to PIL on worker threads; the Tk thread only wraps the
+        # result in a PhotoImage (Tk objects must not be touched off-thread).
+        self._chart_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="sandbox-charts")
+        self._chart_futures: dict[str, Future] = {}
+        self._chart_poll_id: Optional[str] = None
+        self._chart_t0: dict[str, float] = {}              # submit time per pending chart
+        self._chart_ms_window: deque[float] = deque(maxlen=10)   # recent submit->shown times
+        self._prewarm_stop = threading.Event()
 
         self._build()
         self._reset()
+        self._start_prewarm()
 
     # ---------- UI ----------
     def _build(self):
@@ -134,7 +214,10 @@ class SandboxWindow(tk.Toplevel):
         # --- House ---
         q_house = ttk.Frame(left)
         q_house.grid(row=0, column=0, sticky="nsew")
-        self.house_label = ttk.Label(q_house)
+        # One PhotoImage per fixed-size label; refreshes paste() new pixels into
+        # it instead of allocating (and re-binding) a Tk image every frame.
+        self.house_img = ImageTk.PhotoImage("RGBA", size=self.HOUSE_SIZE)
+        self.house_label = ttk.Label(q_house, image=self.house_img)
         self.house_label.pack(fill="both", expand=True, pady=(0, 6))
 
         ttk.Separator(left, orient="horizontal").grid(row=1, column=0, sticky="ew", pady=6)
@@ -144,9 +227,12 @@ class SandboxWindow(tk.Toplevel):
         q_devices.grid(row=2, column=0, sticky="nsew")
         badges = ttk.Frame(q_devices)
         badges.pack(pady=6)
-        self.hvac_label = ttk.Label(badges);  self.hvac_label.grid(row=0, column=0, padx=8, pady=6)
-        self.pv_label   = ttk.Label(badges);  self.pv_label.grid(row=0, column=1, padx=8, pady=6)
-        self.batt_label = ttk.Label(badges);  self.batt_label.grid(row=0, column=2, padx=8, pady=6)
+        self.hvac_img = ImageTk.PhotoImage("RGBA", size=self.BADGE_SIZE)
+        self.pv_img   = ImageTk.PhotoImage("RGBA", size=self.BADGE_SIZE)
+        self.batt_img = ImageTk.PhotoImage("RGBA", size=self.BADGE_SIZE)
+        self.hvac_label = ttk.Label(badges, image=self.hvac_img);  self.hvac_label.grid(row=0, column=0, padx=8, pady=6)
+        self.pv_label   = ttk.Label(badges, image=self.pv_img);    self.pv_label.grid(row=0, column=1, padx=8, pady=6)
+        self.batt_label = ttk.Label(badges, image=self.batt_img);  self.batt_label.grid(row=0, column=2, padx=8, pady=6)
 
         ttk.Separator(left, orient="horizontal").grid(row=3, column=0, sticky="ew", pady=6)
 
@@ -161,23 +247,23 @@ class SandboxWindow(tk.Toplevel):
         self.action_var = tk.DoubleVar(value=0.0)   # HVAC [-1, 1]
         self.pv_on_var  = tk.BooleanVar(value=False)
         self.soc_var    = tk.DoubleVar(value=0.5)   # Battery [0, 1]
+        self._bind_var_traces()
 
         r = 0
         ttk.Label(controls, text="HVAC u").grid(row=r, column=0, sticky="w")
         ttk.Scale(
             controls, from_=-1.0, to=1.0, variable=self.action_var, length=320,
-            orient="horizontal", command=lambda *_: self._refresh_badges()
+            orient="horizontal"
         ).grid(row=r, column=1, columnspan=2, sticky="ew"); r += 1
 
         ttk.Checkbutton(
-            controls, text="PV ON", variable=self.pv_on_var,
-            command=self._refresh_badges
+            controls, text="PV ON", variable=self.pv_on_var
         ).grid(row=r, column=1, sticky="w"); r += 1
 
         ttk.Label(controls, text="Battery SOC").grid(row=r, column=0, sticky="w")
         ttk.Scale(
             controls, from_=0.0, to=1.0, variable=self.soc_var, length=320,
-            orient="horizontal", command=lambda *_: self._refresh_badges()
+            orient="horizontal"
         ).grid(row=r, column=1, columnspan=2, sticky="ew"); r += 1
 
         ttk.Button(controls, text="Step", command=self._step, width=12)\
@@ -202,8 +288,10 @@ class SandboxWindow(tk.Toplevel):
             mid.rowconfigure(rr, weight=1, uniform="midrows")
 
         def _out_row(parent, rix: int, title: str, attr: str):
-            row = tk.LabelFrame(parent, text=title, relief="ridge", borderwidth=1, padx=6, pady=6)
+            row = tk.LabelFrame(parent, text=title, relief="ridge", borderwidth=1, padx=6, pady=6,
+                                width=self.CHART_W, height=self.CH_H_OUT)
             row.grid(row=rix, column=0, sticky="nsew", pady=(0 if rix == 0 else 8, 0))
+            row.pack_propagate(False)   # image swaps must not re-run the outer layout
             placeholder = ttk.Label(row, text="(plot placeholder)", relief="sunken", anchor="center")
             placeholder.pack(fill="both", expand=True, ipady=12)
             setattr(self, attr, placeholder)
@@ -224,20 +312,24 @@ class SandboxWindow(tk.Toplevel):
         for rr in (0, 1, 2):
             charts.rowconfigure(rr, weight=1, uniform="chartrows")
 
-        def _chart_row(parent, rix: int, title: str, attr: str):
-            row = tk.LabelFrame(parent, text=title, relief="ridge", borderwidth=1, padx=6, pady=6)
+        def _chart_row(parent, rix: int, title: str, attr: str, height: int):
+            row = tk.LabelFrame(parent, text=title, relief="ridge", borderwidth=1, padx=6, pady=6,
+                                width=self.CHART_W, height=height)
             row.grid(row=rix, column=0, sticky="nsew", pady=(0 if rix == 0 else 8, 0))
+            # Fixed-size frame: the chart is rendered to the label's size, so letting
+            # the new image propagate would re-run grid layout (and <Configure>) per step.
+            row.pack_propagate(False)
             lbl = ttk.Label(row, relief="flat", anchor="center")
             lbl.pack(fill="both", expand=True)
             setattr(self, attr, lbl)
 
-        _chart_row(charts, 0, "Temp",         "chartA_label")
-        _chart_row(charts, 1, "Price",        "chartB_label")
-        _chart_row(charts, 2, "Weather + PV", "chartC_label")
+        _chart_row(charts, 0, "Temp",         "chartA_label", self.CH_H_TEMP)
+        _chart_row(charts, 1, "Price",        "chartB_label", self.CH_H_PRICE)
+        _chart_row(charts, 2, "Weather + PV", "chartC_label", self.CH_H_WEATHER)
 
         # Re-render charts when any label is resized
         for lbl in (self.chartA_label, self.chartB_label, self.chartC_label):
-            lbl.bind("<Configure>", lambda e: self._refresh_charts())
+            lbl.bind("<Configure>", lambda e: self._schedule_charts())
 
         # Status line
         self.status = ttk.Label(root, text="Ready.", anchor="w")
@@ -248,11 +340,52 @@ class SandboxWindow(tk.Toplevel):
         self.bind("<Return>", lambda e: self._step())
         self.bind("<Escape>", lambda e: self._on_close())
 
+        # Nobody sees a minimized window: stop stepping/redrawing until it's back.
+        self.bind("<Unmap>", self._on_unmap)
+        self.bind("<Map>",   self._on_map)
+
+    def _bind_var_traces(self):
+        # One hook per var instead of per-widget command= callbacks; also fires
+        # when a var is set from code (e.g. by a policy), not just by the widgets.
+        for var in (self.action_var, self.pv_on_var, self.soc_var):
+            var.trace_add("write", self._on_var_write)
+
+    def _on_var_write(self, *_):
+        self._schedule_badges()
+
+    def _start_prewarm(self):
+        """Fill the sprite caches up front so the first Play run doesn't block on PIL."""
+        # Everything is plain PIL now (PhotoImages are only pasted into), so it
+        # all runs on one worker thread: house frames first, then badges.
+        minutes = sorted({int(round(((k * self.dt) % 24.0) * 60.0)) for k in range(self.steps_per_day)})
+        threading.Thread(
+            target=self._prewarm_worker,
+            args=(minutes,),
+            name="sandbox-prewarm",
+            daemon=True,
+        ).start()
+
+    def _prewarm_worker(self, minutes):
+        stop = self._prewarm_stop
+        prewarm_house_frames(minutes, self.HOUSE_SIZE, with_sky=True, stop=stop)
+        # Same 0.01 quantization as _refresh_badges so these hit later.
+        grid = [round(i / 10.0, 2) for i in range(-10, 11)]
+        queue = (
+            [(render_hvac, u) for u in grid]
+            + [(render_battery, round((u + 1.0) / 2.0, 2)) for u in grid]
+            + [(render_pv, on) for on in (False, True)]
+        )
+        for fn, value in queue:
+            if stop.is_set():
+                return
+            fn(value, self.BADGE_SIZE)
+
     # ---------- Session control ----------
     def _reset(self):
         info = self.session.reset()
         self._last_info = dict(info)
-        self._tin_hist.clear()
+        self._tin_arr.fill(np.nan)
+        self._chart_keys.clear()
         self._k = 0
         self.playing = False
         self.play_btn.config(text="▶ Play")
@@ -264,7 +397,9 @@ class SandboxWindow(tk.Toplevel):
             return
 
         u = float(self.action_var.get())
-        info = self.session.step({"u": u})
+        act = self._act_dict
+        act["u"] = u
+        info = self.session.step(act)
         self._last_info = dict(info)
 
         # -------- collect histories for middle-column outputs --------
@@ -281,8 +416,8 @@ class SandboxWindow(tk.Toplevel):
         self._penalty_hist.append(float(info.get("comfort_penalty_eur_step", 0.0)))
         # ----------------------------------------------------------------
 
+        self._tin_arr[self._k] = float(info.get("Tin_c", np.nan))
         self._k += 1
-        self._tin_hist.append(info.get("Tin_c", float("nan")))
         self._refresh_all()
         self.status.config(text=f"Step {self._k}")
         if self._k >= self.T:
@@ -296,39 +431,107 @@ class SandboxWindow(tk.Toplevel):
             return
         self.playing = not self.playing
         self.play_btn.config(text="❚❚ Pause" if self.playing else "▶ Play")
+        if not self.playing:
+            self._refresh_charts()   # strided charts may lag the paused step
         if self.playing:
+            if self._loop_id is not None:   # a tick from before the last pause
+                self.after_cancel(self._loop_id)
+            self._play_t0 = time.monotonic()
+            self._play_step0 = self._k
             self._loop()
 
     def _loop(self):
+        self._loop_id = None
         if not self.playing or self._k >= self.T:
             return
+        if not self._visible:
+            return   # _on_map restarts the loop
+        t_step = time.monotonic()
         self._step()
-        self.after(self.speed_ms, self._loop)
+        if not self.playing:
+            return
+        now = time.monotonic()
+        if now - t_step > STALL_PAUSE_S:
+            self.playing = False
+            self.play_btn.config(text="▶ Play")
+            self.status.config(text=f"Paused: step {self._k} took {now - t_step:.1f}s.")
+            self._refresh_charts()
+            return
+
+        # Schedule against a wall-clock deadline so the play period stays
+        # speed_ms regardless of how long the step itself took.
+        period_s = self.speed_ms / 1000.0
+        target = self._play_t0 + (self._k - self._play_step0) * period_s
+        if now - target > period_s:
+            # fell behind by more than a frame: rebase instead of sprinting to catch up
+            self._play_t0, self._play_step0 = now, self._k
+            target = now
+        self._loop_id = self.after(max(1, int((target - now) * 1000)), self._loop)
+
+    def _on_unmap(self, event):
+        # Toplevel bindings also see child widgets' events; only react to our own.
+        if event.widget is self:
+            self._visible = False
+
+    def _on_map(self, event):
+        if event.widget is not self or self._visible:
+            return
+        self._visible = True
+        self._refresh_all()   # catch up on anything skipped while hidden
+        if self.playing and self._loop_id is None:
+            self._play_t0, self._play_step0 = time.monotonic(), self._k
+            self._loop()
 
     # ---------- Refresh helpers ----------
+    def _schedule_badges(self):
+        # Scale drags fire per pixel; coalesce them into one redraw per ~30 ms.
+        if not self._visible:
+            return
+        if self._badges_after_id is not None:
+            self.after_cancel(self._badges_after_id)
+        self._badges_after_id = self.after(REFRESH_DEBOUNCE_MS, self._do_refresh_badges)
+
+    def _do_refresh_badges(self):
+        self._badges_after_id = None
+        self._refresh_badges()
+
+    def _schedule_charts(self):
+        # <Configure> fires repeatedly while resizing; same coalescing as badges.
+        if not self._visible:
+            return
+        if self._charts_after_id is not None:
+            self.after_cancel(self._charts_after_id)
+        self._charts_after_id = self.after(REFRESH_DEBOUNCE_MS, self._do_refresh_charts)
+
+    def _do_refresh_charts(self):
+        self._charts_after_id = None
+        self._refresh_charts()
+
+    def _chart_stride(self) -> int:
+        """Steps per chart refresh while playing, so renders don't pile up behind the loop."""
+        if not self.playing or not self._chart_ms_window:
+            return 1
+        return int(statistics.median(self._chart_ms_window) // self.speed_ms) + 1
+
     def _refresh_all(self):
         self._refresh_house()
         self._refresh_badges()
-        self._refresh_charts()
+        if self._k % self._chart_stride() == 0 or self._k >= self.T:
+            self._refresh_charts()
         self._refresh_outputs()   # NEW
         
         
     def _refresh_outputs(self):
         # Use the same sliding window as the right-column charts
-        cursor_h   = self._k * self.dt
-        day_start  = math.floor(cursor_h / 24.0) * 24.0
-        span_h     = (1 + self.lookahead_days) * 24.0
-        win_start  = day_start
-        win_end    = day_start + span_h
-
-        k0 = max(0, int(round(win_start / self.dt)))
-        k1 = min(self.T, int(round(win_end   / self.dt)))
-
-        hours_rel = (self.x_abs_h[k0:k1] - win_start).tolist()
+        cursor_h = self._k * self.dt
+        win      = self._day_window()
+        k0       = win.k0
+        win_start = win.win_start
+        hours_rel = win.hours_rel
 
         # Slices from static series
-        people_win = self.people_kw[k0:k1].tolist()
-        pv_win_abs = (self.pv[k0:k1] * PV_KWP).tolist()
+        people_win = win.people_kw
+        pv_win_abs = win.pv_kw
 
         # Histories (only up to current step)
         past_len = max(0, min(self._k - k0, len(hours_rel)))
@@ -349,9 +552,9 @@ class SandboxWindow(tk.Toplevel):
         pen_win     = tail(self._penalty_hist)
 
         # Sizes that match the framed areas (use existing placeholder labels)
-        sz_energy  = self._label_size(getattr(self, "out_hvac_label"), (self.CHART_W, self.CH_H_TEMP))
-        sz_actions = self._label_size(getattr(self, "out_pv_label"),   (self.CHART_W, self.CH_H_TEMP))
-        sz_rewards = self._label_size(getattr(self, "out_batt_label"), (self.CHART_W, self.CH_H_TEMP))
+        sz_energy  = self._label_size(getattr(self, "out_hvac_label"), (self.CHART_W, self.CH_H_OUT))
+        sz_actions = self._label_size(getattr(self, "out_pv_label"),   (self.CHART_W, self.CH_H_OUT))
+        sz_rewards = self._label_size(getattr(self, "out_batt_label"), (self.CHART_W, self.CH_H_OUT))
 
         # 1) Energy: net + stacked components (people + hvac ± batt − pv)
         img_energy = make_energy_breakdown_sprite(
@@ -401,7 +604,7 @@ class SandboxWindow(tk.Toplevel):
         time_minute = int(round(hour_mod * 60.0))
 
         day_idx = int(self.days_col[min(self._k, self.T - 1)])
-        tin  = (self._tin_hist[-1] if self._tin_hist else float(self._last_info.get("Tin_c", 21.0)))
+        tin  = (float(self._tin_arr[self._k - 1]) if self._k > 0 else float(self._last_info.get("Tin_c", 21.0)))
         tout = float(self.tout[min(self._k, self.T - 1)])
 
         step_cost     = float(self._last_info.get("cost_eur_step", 0.0))
@@ -417,7 +620,7 @@ class SandboxWindow(tk.Toplevel):
             f"Total €: energy {cum_cost:.2f}    comfort {cum_penalty:.2f}    reward {cum_reward:.2f}",
         ]
 
-        house_img = sprite_house_from_png(
+        house_im = render_house_from_png(
             time_minute=time_minute,
             tin_c=tin,
             tout_c=tout,
@@ -426,67 +629,166 @@ class SandboxWindow(tk.Toplevel):
             with_sky=True,
         )
 
-        self.house_label.configure(image=house_img)
-        self.house_label.image = house_img
+        self._paste("house", self.house_img, house_im)
 
     def _refresh_badges(self):
-        self.hvac_img  = sprite_hvac(float(self.action_var.get()), size=(220, 220))
-        self.pv_img    = sprite_pv(bool(self.pv_on_var.get()), size=(220, 220))
-        self.batt_img  = sprite_battery(float(self.soc_var.get()), size=(220, 220))
-        self.hvac_label.configure(image=self.hvac_img); self.hvac_label.image = self.hvac_img
-        self.pv_label.configure(image=self.pv_img);     self.pv_label.image   = self.pv_img
-        self.batt_label.configure(image=self.batt_img); self.batt_label.image = self.batt_img
+        # Quantize so the lru_cache'd sprite factories hit instead of redrawing
+        # on every pixel of slider drag; skip entirely if nothing visible changed.
+        key = (
+            round(float(self.action_var.get()), 2),
+            bool(self.pv_on_var.get()),
+            round(float(self.soc_var.get()), 2),
+        )
+        if key == self._badge_key:
+            return
+        self._badge_key = key
+        u_q, pv_on, soc_q = key
+
+        self._paste("hvac", self.hvac_img, render_hvac(u_q, self.BADGE_SIZE))
+        self._paste("pv",   self.pv_img,   render_pv(pv_on, self.BADGE_SIZE))
+        self._paste("batt", self.batt_img, render_battery(soc_q, self.BADGE_SIZE))
+
+    def _paste(self, name: str, photo, im) -> None:
+        # Cached renders come back as the same object: skip re-uploading pixels
+        # Tk already shows (e.g. the PV/battery badges while only u moves).
+        # Holding `im` keeps the identity check valid.
+        if self._pasted.get(name) is im:
+            return
+        photo.paste(im)
+        self._pasted[name] = im
 
     def _refresh_charts(self):
         # Window for today (+ optional tomorrow)
-        cursor_h   = self._k * self.dt
-        day_start  = math.floor(cursor_h / 24.0) * 24.0
-        span_h     = (1 + self.lookahead_days) * 24.0
-        win_start  = day_start
-        win_end    = day_start + span_h
-
-        k0 = max(0, int(round(win_start / self.dt)))
-        k1 = min(self.T, int(round(win_end   / self.dt)))
-
-        hours_rel = (self.x_abs_h[k0:k1] - win_start).tolist()
-        price_win = self.price[k0:k1].tolist()
-        tout_win  = self.tout[k0:k1].tolist()
-        pv_win    = self.pv[k0:k1].tolist()
-
-        past_len = max(0, min(self._k - k0, len(hours_rel)))
-        tin_hist_win = self._tin_hist[-past_len:] if past_len > 0 else []
+        cursor_h  = self._k * self.dt
+        win       = self._day_window()
+        k0, k1    = win.k0, win.k1
+        win_start = win.win_start
 
         # Sizes that match the framed chart areas
         sz_temp   = self._label_size(self.chartA_label, (self.CHART_W, self.CH_H_TEMP))
         sz_price  = self._label_size(self.chartB_label, (self.CHART_W, self.CH_H_PRICE))
         sz_weath  = self._label_size(self.chartC_label, (self.CHART_W, self.CH_H_WEATHER))
 
-        temp_img = make_temp_chart_sprite(
-            hours=hours_rel, tin_hist=tin_hist_win,
-            comfort_L=21.0 - 1.0, comfort_U=21.0 + 1.0,
-            size=sz_temp,cursor_hour=cursor_h - win_start,
-            margins=(12, 10, 12, 12), outer_pad=(20,20,20,20),  # extra for time badge
-        )
-        self.chartA_label.configure(image=temp_img); self.chartA_label.image = temp_img
+        # Fingerprints: window, target size and step (= cursor position and Tin
+        # history length). Unchanged charts keep their current image.
+        keys = {
+            "temp":    (k0, k1, sz_temp,  self._k),
+            "price":   (k0, k1, sz_price, self._k),
+            "weather": (k0, k1, sz_weath, self._k),
+        }
+        dirty = {name for name, key in keys.items() if self._chart_keys.get(name) != key}
+        if not dirty:
+            return
+        self._chart_keys.update(keys)
 
-        price_img = make_price_chart_sprite(
-            hours=hours_rel, price=price_win,
-            size=sz_price,cursor_hour=cursor_h - win_start,
-            margins=(12, 10, 12, 12), outer_pad=(30,30,30,30),
-        )
-        self.chartB_label.configure(image=price_img); self.chartB_label.image = price_img
+        hours_rel = win.hours_rel
 
-        weather_img = make_weather_pv_chart_sprite(
-            hours=hours_rel, tout=tout_win, pv=pv_win,
-            size=sz_weath,cursor_hour=cursor_h - win_start,
-            margins=(12, 10, 36, 12), outer_pad=(10,10,10,10),  # extra right for PV ticks
-        )
-        self.chartC_label.configure(image=weather_img); self.chartC_label.image = weather_img
+        if "temp" in dirty:
+            # copy: the worker must not see _tin_arr being refilled on reset
+            # (fancy indexing below copies too)
+            hours, tin = hours_rel, self._tin_arr[k0:min(self._k, k1)]
+            idx = _decimate_idx(len(hours), sz_temp[0])
+            if idx is None:
+                tin = tin.copy()
+            else:
+                hours, tin = hours[idx], tin[idx[idx < len(tin)]]
+            self._submit_chart(
+                "temp", render_temp_chart,
+                hours=hours, tin_hist=tin,
+                comfort_L=21.0 - 1.0, comfort_U=21.0 + 1.0,
+                size=sz_temp,cursor_hour=cursor_h - win_start,
+                margins=(12, 10, 12, 12), outer_pad=(20,20,20,20),  # extra for time badge
+            )
+
+        if "price" in dirty:
+            hours, price = hours_rel, win.price
+            idx = _decimate_idx(len(hours), sz_price[0])
+            if idx is not None:
+                hours, price = hours[idx], price[idx]
+            self._submit_chart(
+                "price", render_price_chart,
+                hours=hours, price=price,
+                size=sz_price,cursor_hour=cursor_h - win_start,
+                margins=(12, 10, 12, 12), outer_pad=(30,30,30,30),
+            )
+
+        if "weather" in dirty:
+            hours, tout, pv = hours_rel, win.tout, win.pv
+            idx = _decimate_idx(len(hours), sz_weath[0])
+            if idx is not None:
+                hours, tout, pv = hours[idx], tout[idx], pv[idx]
+            self._submit_chart(
+                "weather", render_weather_pv_chart,
+                hours=hours, tout=tout, pv=pv,
+                size=sz_weath,cursor_hour=cursor_h - win_start,
+                margins=(12, 10, 36, 12), outer_pad=(10,10,10,10),  # extra right for PV ticks
+            )
+
+    def _submit_chart(self, name: str, render, **kwargs):
+        # A newer request supersedes any pending render of the same chart.
+        old = self._chart_futures.get(name)
+        if old is not None:
+            old.cancel()
+        self._chart_futures[name] = self._chart_pool.submit(render, **kwargs)
+        self._chart_t0[name] = time.perf_counter()
+        if self._chart_poll_id is None:
+            self._chart_poll_id = self.after(CHART_POLL_MS, self._poll_charts)
+
+    def _poll_charts(self):
+        self._chart_poll_id = None
+        labels = {"temp": self.chartA_label, "price": self.chartB_label, "weather": self.chartC_label}
+        for name, fut in list(self._chart_futures.items()):
+            if not fut.done():
+                continue
+            del self._chart_futures[name]
+            if fut.cancelled():
+                continue
+            try:
+                pil_img = fut.result()
+            except Exception as e:
+                # Keep polling the other charts; forgetting the fingerprint makes
+                # the next refresh re-render this one.
+                self._chart_keys.pop(name, None)
+                logging.getLogger(__name__).exception("Chart render %r failed", name)
+                self.status.config(text=f"Chart '{name}' failed: {e.__class__.__name__}: {e}")
+                continue
+            img = ImageTk.PhotoImage(pil_img)
+            labels[name].configure(image=img); labels[name].image = img
+            self._chart_ms_window.append((time.perf_counter() - self._chart_t0[name]) * 1000.0)
+        if self._chart_futures:
+            self._chart_poll_id = self.after(CHART_POLL_MS, self._poll_charts)
 
     def _on_close(self):
         self.playing = False
+        self._prewarm_stop.set()
+        for after_id in (self._loop_id, self._badges_after_id, self._charts_after_id, self._chart_poll_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._chart_pool.shutdown(wait=False, cancel_futures=True)
         self.destroy()
 
+    def _build_day_windows(self) -> list[_DayWindow]:
+        """One window per game day (plus the empty one past the end), as array views."""
+        span = (1 + self.lookahead_days) * self.steps_per_day
+        windows: list[_DayWindow] = []
+        for d in range(self.T // self.steps_per_day + 1):
+            k0 = min(self.T, d * self.steps_per_day)
+            k1 = min(self.T, k0 + span)
+            win_start = 24.0 * d
+            windows.append(_DayWindow(
+                k0=k0, k1=k1, win_start=win_start,
+                hours_rel=self.x_abs_h[k0:k1] - win_start,
+                price=self.price[k0:k1],
+                tout=self.tout[k0:k1],
+                pv=self.pv[k0:k1],
+                people_kw=self.people_kw[k0:k1],
+                pv_kw=self.pv[k0:k1] * PV_KWP,
+            ))
+        return windows
+
+    def _day_window(self) -> _DayWindow:
+        return self._day_windows[min(self._k // self.steps_per_day, len(self._day_windows) - 1)]
+
     def _label_size(self, lbl: tk.Widget, fallback: Tuple[int,int]) -> Tuple[int,int]:
         w, h = lbl.winfo_width(), lbl.winfo_height()
         if w < 10 or h < 10:
@@ -497,8 +799,6 @@ class SandboxWindow(tk.Toplevel):
         """
         Align profile series to the main absolute-hour axis via linear interpolation.
         """
-        import numpy as np
-
         # main axis in hours
         t_main = np.arange(N_main, dtype=float) * dt_main
 
@@ -515,6 +815,12 @@ class SandboxWindow(tk.Toplevel):
 
 
     # ---------- Data ----------
+    @staticmethod
+    def _f32(values) -> np.ndarray:
+        if isinstance(values, pd.Series):
+            values = values.to_numpy(dtype=np.float32, copy=False)
+        return np.ascontiguousarray(values, dtype=np.float32)
+
     @staticmethod
     def _load_profile(path: str) -> pd.DataFrame:
         """
@@ -544,19 +850,15 @@ class SandboxWindow(tk.Toplevel):
 
     @staticmethod
     def _load_day(path: str) -> pd.DataFrame:
+        """
+        Parse the scenario CSV and add derived columns. The prepared frame is
+        cached in a sibling .parquet (reused while newer than the CSV) and in
+        memory per (path, mtime), so reopening the sandbox skips the text parse
+        until the file changes. Callers must treat the returned frame as read-only.
+        A missing or malformed CSV yields a small placeholder frame (not cached).
+        """
         try:
-            df = pd.read_csv(path)
-            need = ["t", "dt_h", "t_out_c", "price_eur_per_kwh"]
-            for c in need:
-                if c not in df.columns:
-                    raise ValueError(f"CSV missing column: {c}")
-            if "hour_of_day" not in df.columns:
-                df["hour_of_day"] = (df["t"] * float(df["dt_h"].iloc[0])) % 24.0
-            if "solar_gen_kw_per_kwp" not in df.columns:
-                df["solar_gen_kw_per_kwp"] = 0.0
-            if "day" not in df.columns:
-                df["day"] = (df["t"] * df["dt_h"] // 24).astype(int) + 1
-            return df
+            return SandboxWindow._load_day_cached(os.path.abspath(path), os.path.getmtime(path))
         except Exception:
             return pd.DataFrame(
                 {
@@ -569,3 +871,38 @@ class SandboxWindow(tk.Toplevel):
                     "day": [1, 1, 1, 1],
                 }
             )
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _load_day_cached(path: str, mtime: float) -> pd.DataFrame:
+        # Raises on a bad file, so failures are never cached.
+        csv = Path(path)
+        cache = csv.with_suffix(".parquet")
+        try:
+            if cache.exists() and cache.stat().st_mtime >= mtime:
+                return pd.read_parquet(cache)
+        except Exception:
+            pass  # no parquet engine or unreadable cache -> reparse the CSV
+        # Skip unused columns and dtype inference; a callable usecols
+        # tolerates the optional columns being missing.
+        df = pd.read_csv(
+            path,
+            usecols=lambda c: c in _DAY_CSV_DTYPES,
+            dtype=_DAY_CSV_DTYPES,
+            engine="c",
+        )
+        need = ["t", "dt_h", "t_out_c", "price_eur_per_kwh"]
+        for c in need:
+            if c not in df.columns:
+                raise ValueError(f"CSV missing column: {c}")
+        if "hour_of_day" not in df.columns:
+            df["hour_of_day"] = (df["t"] * float(df["dt_h"].iloc[0])) % 24.0
+        if "solar_gen_kw_per_kwp" not in df.columns:
+            df["solar_gen_kw_per_kwp"] = 0.0
+        if "day" not in df.columns:
+            df["day"] = (df["t"] * df["dt_h"] // 24).astype(int) + 1
+        try:
+            df.to_parquet(cache, compression="zstd")
+        except Exception:
+            pass  # parquet engine (pyarrow/fastparquet) is optional
+        return df
@@ -1,58 +1,63 @@
 from __future__ import annotations
 
+import logging
 import math
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Tuple, Iterable
 
+import numpy as np
+import PIL
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 
+from .assets import load_font
 # Import the image renderer; we wrap it to return a Tk PhotoImage
-from .house_spline_runtime import render_house_png
+from .house_spline_runtime import render_house_png, reserve_house_frames
 
-__all__ = ["sprite_pv", "sprite_hvac", "sprite_battery", "sprite_house_from_png"]
+# Pillow-SIMD (the `simd` extra) is API-identical and vectorises the resize /
+# alpha_composite calls house rendering spends its time in; its versions carry a
+# ".postN" suffix. Logged at INFO so stock installs stay quiet by default.
+if "post" not in PIL.__version__:
+    logging.getLogger(__name__).info(
+        "Using stock Pillow %s; install the 'simd' extra (pillow-simd) for faster sprite rendering.",
+        PIL.__version__,
+    )
+
+__all__ = [
+    "render_pv", "render_hvac", "render_battery", "render_house_from_png",
+    "sprite_pv", "sprite_hvac", "sprite_battery", "sprite_house_from_png", "prewarm_house_frames",
+]
 
 
 # ---------- helpers ----------
+# Fonts come from assets.load_font (resolved once per size, family list and thread).
+_TITLE_FONTS = ("Segoe UI Semibold", "Segoe UI", "Arial", "DejaVuSans")
+_BODY_FONTS = ("Segoe UI", "SegoeUI", "Arial", "DejaVuSansMono", "DejaVuSans")
+
+def _font_px(px: int, names: Tuple[str, ...] = _BODY_FONTS) -> ImageFont.ImageFont:
+    return load_font(px, names)
+
 def _font(big: bool = False):
-    size = 56 if big else 28
-    for name in ("Segoe UI Semibold", "Segoe UI", "Arial", "DejaVuSans"):
-        for candidate in (name, name + ".ttf"):
-            try:
-                return ImageFont.truetype(candidate, size)
-            except Exception:
-                pass
-    return ImageFont.load_default()
-
-def _font_px(px: int) -> ImageFont.ImageFont:
-    for name in ("Segoe UI", "SegoeUI", "Arial", "DejaVuSansMono", "DejaVuSans"):
-        for cand in (name, f"{name}.ttf"):
-            try:
-                return ImageFont.truetype(cand, px)
-            except Exception:
-                pass
-    return ImageFont.load_default()
+    return _font_px(56 if big else 28, _TITLE_FONTS)
+
+# rounded_rectangle arrived in Pillow 8.2; probe once instead of try/except per draw.
+_HAS_ROUNDED = hasattr(ImageDraw.ImageDraw, "rounded_rectangle")
 
 def _rounded_panel(size: Tuple[int, int], bg: Tuple[int, int, int], radius: int = 24):
     w, h = size
     im = Image.new("RGBA", size, (0, 0, 0, 0))
     d = ImageDraw.Draw(im)
-    try:
+    if _HAS_ROUNDED:
         d.rounded_rectangle([0, 0, w - 1, h - 1], radius=radius,
                             fill=bg, outline=(255, 255, 255, 160), width=3)
-    except Exception:
+    else:
         d.rectangle([0, 0, w - 1, h - 1], fill=bg, outline=(255, 255, 255, 160), width=3)
     return im, d
 
-def _text_size(draw: ImageDraw.ImageDraw, text: str, font) -> Tuple[int, int]:
-    try:
-        l, t, r, b = draw.textbbox((0, 0), text, font=font)
-        return r - l, b - t
-    except Exception:
-        try:
-            return font.getsize(text)
-        except Exception:
-            return (len(text) * 8, 16)
+def _text_size(text: str, font) -> Tuple[int, int]:
+    # font.getbbox == draw.textbbox at (0, 0) for single-line text, minus the Draw.
+    l, t, r, b = font.getbbox(text)
+    return r - l, b - t
 
 def _clamp01(x: float) -> float:
     return max(0.0, min(1.0, float(x)))
@@ -70,22 +75,55 @@ class Palette:
 
 PALETTE = Palette()
 
+# Same colours as uint8[3] arrays for vectorised blending (ramps, LUTs).
+PALETTE_ARR = {
+    name: np.array(getattr(PALETTE, name), dtype=np.uint8)
+    for name in ("red", "amber", "green", "blue", "gray", "dark")
+}
+
+
+def _battery_lut(n: int) -> np.ndarray:
+    """uint8[n + 1, 3] red -> amber -> green ramp, one row per SoC bucket."""
+    red, amber, green = (PALETTE_ARR[c].astype(np.float64) for c in ("red", "amber", "green"))
+    s = np.arange(n + 1, dtype=np.float64)[:, None] / n
+    t_lo = s / 0.5
+    t_hi = (s - 0.5) / 0.5
+    lo = (1 - t_lo) * red + t_lo * amber
+    hi = (1 - t_hi) * amber + t_hi * green
+    return np.where(s < 0.5, lo, hi).astype(np.uint8)   # truncates like int()
+
 
 # ---------- device sprites ----------
-@lru_cache(maxsize=256)
-def sprite_pv(on: bool, size: Tuple[int, int] = (200, 200)) -> ImageTk.PhotoImage:
-    bg = PALETTE.green if on else PALETTE.gray
-    im, d = _rounded_panel(size, bg)
+# render_* build (and cache) plain PIL images, so they can run off the Tk thread
+# and be pasted into a long-lived PhotoImage; sprite_* wrap them for one-off use.
+# Cached images are shared: callers must not draw on them.
+#
+# Float inputs snap to one bucket per displayed percent before the cache
+# lookup, so slider values that look identical share a frame (201 HVAC /
+# 101 battery keys per size instead of one per float).
+_PCT_BUCKETS = 100
+_BATTERY_LUT = _battery_lut(_PCT_BUCKETS)
+
+# Unit vectors of the 12 sun rays (every 30°), scaled per sprite size.
+_SUN_RAYS = tuple(
+    (math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 30)
+)
+
+@lru_cache(maxsize=8)
+def _pv_overlay(size: Tuple[int, int]) -> Tuple[Image.Image, Image.Image]:
+    """Sun, rays and panel grid for one size, plus a mask of the drawn pixels."""
     w, h = size
-    f_big = _font(True)
+    art = Image.new("RGBA", size, (0, 0, 0, 0))
+    d = ImageDraw.Draw(art)
 
     # sun
     sun_cx, sun_cy, sun_r = int(w * 0.28), int(h * 0.28), int(min(w, h) * 0.12)
     d.ellipse([sun_cx - sun_r, sun_cy - sun_r, sun_cx + sun_r, sun_cy + sun_r],
               fill=(255, 240, 150, 240))
-    for a in range(0, 360, 30):
-        dx = int(sun_r * 1.6 * math.cos(math.radians(a)))
-        dy = int(sun_r * 1.6 * math.sin(math.radians(a)))
+    ray = sun_r * 1.6
+    for ux, uy in _SUN_RAYS:
+        dx = int(ray * ux)
+        dy = int(ray * uy)
         d.line([(sun_cx, sun_cy), (sun_cx + dx, sun_cy + dy)],
                fill=(255, 240, 150, 220), width=3)
 
@@ -99,15 +137,34 @@ def sprite_pv(on: bool, size: Tuple[int, int] = (200, 200)) -> ImageTk.PhotoImag
         y = h - int(h * 0.40) + j * ((int(h * 0.40) - pad) / 3)
         d.line([(pad, y), (w - pad, y)], fill=(255, 255, 255, 90), width=2)
 
+    # every fill above has alpha > 0, so alpha != 0 marks exactly the drawn pixels
+    mask = art.getchannel("A").point(lambda a: 255 if a else 0)
+    return art, mask
+
+
+@lru_cache(maxsize=256)
+def render_pv(on: bool, size: Tuple[int, int] = (200, 200)) -> Image.Image:
+    bg = PALETTE.green if on else PALETTE.gray
+    im, d = _rounded_panel(size, bg)
+    w, h = size
+    f_big = _font(True)
+    art, mask = _pv_overlay(tuple(size))
+    im.paste(art, (0, 0), mask)   # masked paste = same pixel replacement as drawing
+
     text = "PV ON" if on else "PV OFF"
-    tw, th = _text_size(d, text, f_big)
+    tw, th = _text_size(text, f_big)
     d.text(((w - tw) // 2, int(h * 0.02)), text, fill=(255, 255, 255, 255), font=f_big)
-    return ImageTk.PhotoImage(im)
+    return im
 
 
-@lru_cache(maxsize=256)
-def sprite_hvac(u_bidir: float, size: Tuple[int, int] = (200, 200)) -> ImageTk.PhotoImage:
+def render_hvac(u_bidir: float, size: Tuple[int, int] = (200, 200)) -> Image.Image:
     u = max(-1.0, min(1.0, float(u_bidir)))
+    return _render_hvac_pil(int(round(u * _PCT_BUCKETS)), tuple(size))
+
+
+@lru_cache(maxsize=256)
+def _render_hvac_pil(bucket: int, size: Tuple[int, int]) -> Image.Image:
+    u = bucket / _PCT_BUCKETS
     heating = u > 0
     bg = PALETTE.red if heating else (PALETTE.blue if u < 0 else PALETTE.gray)
     im, d = _rounded_panel(size, bg)
@@ -118,51 +175,49 @@ def sprite_hvac(u_bidir: float, size: Tuple[int, int] = (200, 200)) -> ImageTk.P
     pct = int(round(abs(u) * 100))
     mode = "HEAT" if heating else ("COOL" if u < 0 else "IDLE")
     title = f"HVAC {('+' if heating else ('-' if u < 0 else '±'))}{pct}%"
-    tw, th = _text_size(d, title, f_big)
+    tw, th = _text_size(title, f_big)
     d.text(((w - tw) // 2, 12), title, fill=(255, 255, 255, 255), font=f_big)
-    mw, mh = _text_size(d, mode, f)
+    mw, mh = _text_size(mode, f)
     d.text(((w - mw) // 2, 16 + th), mode, fill=(255, 255, 255, 210), font=f)
 
     pad = 18
     bar_w = w - 2 * pad
     bar_h = 22
     y0 = h - pad - bar_h
-    try:
+    filled = int(bar_w * abs(u))
+    if _HAS_ROUNDED:
         d.rounded_rectangle([pad, y0, pad + bar_w, y0 + bar_h], radius=10, fill=(255, 255, 255, 60))
-        filled = int(bar_w * abs(u))
         d.rounded_rectangle([pad, y0, pad + filled, y0 + bar_h], radius=10, fill=(255, 255, 255, 220))
-    except Exception:
+    else:
         d.rectangle([pad, y0, pad + bar_w, y0 + bar_h], fill=(255, 255, 255, 60))
-        filled = int(bar_w * abs(u))
         d.rectangle([pad, y0, pad + filled, y0 + bar_h], fill=(255, 255, 255, 220))
-    return ImageTk.PhotoImage(im)
+    return im
+
+
+def render_battery(soc01: float, size: Tuple[int, int] = (200, 200)) -> Image.Image:
+    return _render_battery_pil(int(round(_clamp01(soc01) * _PCT_BUCKETS)), tuple(size))
 
 
 @lru_cache(maxsize=256)
-def sprite_battery(soc01: float, size: Tuple[int, int] = (200, 200)) -> ImageTk.PhotoImage:
-    s = _clamp01(soc01)
-    if s < 0.5:
-        t = s / 0.5
-        col = tuple(int((1 - t) * PALETTE.red[i] + t * PALETTE.amber[i]) for i in range(3))
-    else:
-        t = (s - 0.5) / 0.5
-        col = tuple(int((1 - t) * PALETTE.amber[i] + t * PALETTE.green[i]) for i in range(3))
+def _render_battery_pil(bucket: int, size: Tuple[int, int]) -> Image.Image:
+    s = bucket / _PCT_BUCKETS
+    col = tuple(int(c) for c in _BATTERY_LUT[bucket])
     im, d = _rounded_panel(size, col)
     w, h = size
     f_big = _font(True)
     f = _font(False)
 
     title = "BATTERY"
-    tw, th = _text_size(d, title, f_big)
+    tw, th = _text_size(title, f_big)
     d.text(((w - tw) // 2, 12), title, fill=(255, 255, 255, 255), font=f_big)
 
     bw, bh = int(w * 0.72), int(h * 0.34)
     x0, y0 = (w - bw) // 2, int(h * 0.40)
     cap = int(bw * 0.06)
-    try:
+    if _HAS_ROUNDED:
         d.rounded_rectangle([x0, y0, x0 + bw, y0 + bh], radius=12,
                             outline=(255, 255, 255, 210), width=3, fill=(0, 0, 0, 30))
-    except Exception:
+    else:
         d.rectangle([x0, y0, x0 + bw, y0 + bh], outline=(255, 255, 255, 210),
                     width=3, fill=(0, 0, 0, 30))
     d.rectangle([x0 + bw + 4, y0 + bh * 0.30, x0 + bw + 4 + cap, y0 + bh * 0.70],
@@ -176,13 +231,49 @@ def sprite_battery(soc01: float, size: Tuple[int, int] = (200, 200)) -> ImageTk.
                 fill=(255, 255, 255, 220))
 
     pct = f"{int(round(100 * s))}%"
-    pw, ph = _text_size(d, pct, f)
+    pw, ph = _text_size(pct, f)
     d.text((x0 + (bw - pw) // 2, y0 + (bh - ph) // 2), pct, fill=(0, 0, 0, 230), font=f)
-    return ImageTk.PhotoImage(im)
+    return im
+
+
+def sprite_pv(on: bool, size: Tuple[int, int] = (200, 200)) -> ImageTk.PhotoImage:
+    return ImageTk.PhotoImage(render_pv(on, size))
+
+
+def sprite_hvac(u_bidir: float, size: Tuple[int, int] = (200, 200)) -> ImageTk.PhotoImage:
+    return ImageTk.PhotoImage(render_hvac(u_bidir, size))
+
+
+def sprite_battery(soc01: float, size: Tuple[int, int] = (200, 200)) -> ImageTk.PhotoImage:
+    return ImageTk.PhotoImage(render_battery(soc01, size))
 
 
 # ---------- house sprite wrapper ----------
-def sprite_house_from_png(
+def _house_base(time_minute: int, size: Tuple[int, int], with_sky: bool) -> Image.Image:
+    # Single call shape into the memoized renderer so prewarm and draw share cache keys.
+    return render_house_png(time_minute, size=size, with_sky=with_sky, show_time=False, sharpen=True)
+
+
+def prewarm_house_frames(
+    time_minutes: Iterable[int],
+    size: Tuple[int, int],
+    *,
+    with_sky: bool = True,
+    stop=None,
+) -> None:
+    """
+    Render the house base for each minute into the cache. PIL only, so this is
+    safe to run on a worker thread; `stop` (a threading.Event) aborts early.
+    """
+    time_minutes = list(time_minutes)
+    reserve_house_frames(len(time_minutes))
+    for m in time_minutes:
+        if stop is not None and stop.is_set():
+            return
+        _house_base(int(m), tuple(size), bool(with_sky))
+
+
+def render_house_from_png(
     *,
     time_minute: int,
     tin_c: float,
@@ -190,37 +281,30 @@ def sprite_house_from_png(
     size: Tuple[int, int],
     lines: Iterable[str] = (),
     with_sky: bool = True,
-) -> ImageTk.PhotoImage:
+) -> Image.Image:
     """
-    Render the tinted house PNG via render_house_png(...), overlay Tin/Tout + lines,
-    and return a Tk PhotoImage.
+    Render the tinted house PNG via render_house_png(...) and overlay Tin/Tout + lines.
+    Returns a fresh PIL image (the cached base is copied before drawing).
     """
-    im = render_house_png(
-        time_minute,
-        size=size,
-        with_sky=with_sky,
-        show_time=False,
-        sharpen=True,
-    ).copy()
+    im = _house_base(time_minute, tuple(size), bool(with_sky)).copy()
 
-    d = ImageDraw.Draw(im)
+    # Explicit mode matches the base (so no blend setup); bound method hoisted for the loop.
+    d = ImageDraw.Draw(im, "RGBA")
+    draw_text = d.text
     W, H = im.size
     f_head = _font_px(max(12, int(H * 0.045)))
     f_line = _font_px(max(11, int(H * 0.040)))
 
     header = f"Tin {tin_c:.1f}°C   Tout {tout_c:.1f}°C"
 
-    # measure multi-line box
-    pad_x, pad_y = 10, 8
-    gap = 4
-    lines_list = [header] + list(lines)
-    widths, heights = [], []
-    for s in lines_list:
-        w, h = _text_size(d, s, f_head if s is header else f_line)
-        widths.append(w); heights.append(h)
+    # (text, font, fill, height) for header + lines, measured in one pass
+    pad_x, pad_y, gap = 10, 8, 4
+    items = [(header, f_head, (245, 245, 245, 255))]
+    items += [(str(s), f_line, (235, 235, 235, 230)) for s in (lines or ())]
+    sizes = [_text_size(text, font) for text, font, _ in items]
 
-    box_w = max(widths) + 2 * pad_x
-    box_h = (sum(heights) + (len(lines_list) - 1) * gap) + 2 * pad_y
+    box_w = max(w for w, _ in sizes) + 2 * pad_x
+    box_h = sum(h for _, h in sizes) + (len(items) - 1) * gap + 2 * pad_y
 
     # bottom-left placement
     bx0 = 10
@@ -229,17 +313,20 @@ def sprite_house_from_png(
     by1 = by0 + box_h
 
     # backdrop
-    try:
+    if _HAS_ROUNDED:
         d.rounded_rectangle([bx0, by0, bx1, by1], radius=10, fill=(0, 0, 0, 90))
-    except Exception:
+    else:
         d.rectangle([bx0, by0, bx1, by1], fill=(0, 0, 0, 90))
 
     # draw lines
-    y = by0 + pad_y
-    d.text((bx0 + pad_x, y), header, fill=(245, 245, 245, 255), font=f_head)
-    y += heights[0] + gap
-    for i, s in enumerate(lines_list[1:], start=1):
-        d.text((bx0 + pad_x, y), s, fill=(235, 235, 235, 230), font=f_line)
-        y += heights[i] + gap
-
-    return ImageTk.PhotoImage(im)
+    x, y = bx0 + pad_x, by0 + pad_y
+    for (text, font, fill), (_, h) in zip(items, sizes):
+        draw_text((x, y), text, fill=fill, font=font)
+        y += h + gap
+
+    return im
+
+
+def sprite_house_from_png(**kwargs) -> ImageTk.PhotoImage:
+    """Same as render_house_from_png(...), wrapped in a Tk PhotoImage."""
+    return ImageTk.PhotoImage(render_house_from_png(**kwargs))
@@ -10,6 +10,37 @@ from tkinter import ttk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+try:
+    from numba import njit  # type: ignore  # optional JIT for per-step series math
+except Exception:  # pragma: no cover
+    njit = None
+
+
+def _comfort_violation_loop(tin, L, U, n):
+    s = 0.0
+    for i in range(n):
+        x = tin[i]
+        if x < L:
+            s += L - x
+        elif x > U:
+            s += x - U
+    return s
+
+
+def _comfort_violation_np(tin, L, U, n):
+    x = tin[:n]
+    return float(np.nansum(np.maximum(L - x, 0.0)) + np.nansum(np.maximum(x - U, 0.0)))
+
+
+# Sum of °C outside [L, U] over the first n samples (NaNs count as 0).
+# Compiled when numba is installed, vectorised NumPy otherwise. Only the
+# reassoc/contract fast-math flags: full fastmath implies "nnan", which would
+# make the NaN comparisons above undefined.
+comfort_violation = (
+    njit(cache=True, fastmath={"reassoc", "contract"})(_comfort_violation_loop) if njit is not None
+    else _comfort_violation_np
+)
+
 
 @dataclass(frozen=True)
 class ComfortSpec:
@@ -31,23 +62,32 @@ class ChartsPanel(ttk.Frame):
     """
     def __init__(self, master, df: pd.DataFrame, *, comfort: ComfortSpec = ComfortSpec()):
         super().__init__(master)
-        self.df = df.reset_index(drop=True).copy()
+        # Only the column arrays are kept; the frame itself is not copied or stored
+        # (everything below is positional, so the caller's index doesn't matter).
         self.comfort = comfort
 
         # --- derive x-axis (hours) ---
-        if "hour_of_day" in self.df.columns:
-            self.hours = self.df["hour_of_day"].to_numpy(dtype=float)
+        if "hour_of_day" in df.columns:
+            self.hours = df["hour_of_day"].to_numpy(dtype=float)
+        else:
+            dt_h = float(df["dt_h"].iloc[0])
+            self.hours = np.arange(df.shape[0], dtype=float) * dt_h
+        if "dt_h" in df.columns:
+            self._dt_h = float(df["dt_h"].iloc[0])
         else:
-            dt_h = float(self.df["dt_h"].iloc[0])
-            self.hours = np.arange(self.df.shape[0], dtype=float) * dt_h
+            self._dt_h = float(self.hours[1] - self.hours[0]) if len(self.hours) > 1 else 0.0
 
         # --- series ---
-        self.price = self.df["price_eur_per_kwh"].to_numpy(dtype=float)
-        self.tout  = self.df["t_out_c"].to_numpy(dtype=float)
-        self.pv    = self.df.get("solar_gen_kw_per_kwp", pd.Series(np.zeros_like(self.hours))).to_numpy(dtype=float)
+        self.price = df["price_eur_per_kwh"].to_numpy(dtype=float)
+        self.tout  = df["t_out_c"].to_numpy(dtype=float)
+        if "solar_gen_kw_per_kwp" in df.columns:
+            self.pv = df["solar_gen_kw_per_kwp"].to_numpy(dtype=float)
+        else:
+            self.pv = np.zeros_like(self.hours)
 
-        # placeholder for Tin history (grow as we step)
-        self.tin_hist: list[float] = []
+        # Tin history: fixed NaN buffer over the x-axis, first _n entries filled
+        self._tin_buf = np.full(self.hours.shape[0], np.nan, dtype=np.float64)
+        self._n = 0
 
         # --- figure layout ---
         self.fig = Figure(figsize=(7.5, 5.2), dpi=100)
@@ -63,8 +103,10 @@ class ChartsPanel(ttk.Frame):
         self.axA.axhline(comfort.L, color="tab:green", lw=1, alpha=0.6)
         self.axA.axhline(comfort.U, color="tab:green", lw=1, alpha=0.6)
         # Tin line (empty initially)
-        self.line_tin, = self.axA.plot(self.hours, np.full_like(self.hours, np.nan), lw=2.0, label="Tin")
+        self.line_tin, = self.axA.plot(self.hours, self._tin_buf, lw=2.0, label="Tin")
         self.axA.legend(loc="upper right", frameon=False)
+        self.txt_violation = self.axA.text(0.01, 0.95, "", transform=self.axA.transAxes,
+                                           ha="left", va="top", fontsize=9)
 
         # B) Price
         self.axB = self.fig.add_subplot(gs[1], sharex=self.axA)
@@ -89,35 +131,65 @@ class ChartsPanel(ttk.Frame):
         self.vB = self.axB.axvline(self.hours[0], color="k", lw=1, alpha=0.6)
         self.vC = self.axC.axvline(self.hours[0], color="k", lw=1, alpha=0.6)
 
+        # Per-step artists are animated: full draws skip them and they're blitted
+        # over a cached background instead of redrawing all three subplots.
+        for artist in (self.line_tin, self.txt_violation, self.vA, self.vB, self.vC):
+            artist.set_animated(True)
+
         # --- canvas ---
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
+        self._bg = None
+        # every full draw (first show, resize) re-captures the background
+        self.canvas.mpl_connect("draw_event", self._on_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
     # API used by Sandbox
     def reset(self):
-        self.tin_hist.clear()
+        self._tin_buf.fill(np.nan)
+        self._n = 0
         self._update_tin_line()
+        self.txt_violation.set_text("")
         self._move_cursor(0)
-        self.canvas.draw_idle()
+        self._blit()
 
     def append_tin(self, value_c: float):
-        self.tin_hist.append(float(value_c))
+        self._tin_buf[self._n] = float(value_c)
+        self._n += 1
         self._update_tin_line()
+        self._blit()
 
     def set_cursor_index(self, k: int):
         k = int(max(0, min(k, len(self.hours) - 1)))
         self._move_cursor(k)
+        self._blit()
 
     # --- internals ---
     def _update_tin_line(self):
-        n = len(self.tin_hist)
-        y = np.full_like(self.hours, np.nan, dtype=float)
-        if n > 0:
-            y[:n] = np.asarray(self.tin_hist, dtype=float)
-        self.line_tin.set_ydata(y)
+        self.line_tin.set_ydata(self._tin_buf)
+        if self._n:
+            v = comfort_violation(self._tin_buf, self.comfort.L, self.comfort.U, self._n)
+            self.txt_violation.set_text(f"Outside comfort: {v * self._dt_h:.2f} °C·h")
 
     def _move_cursor(self, k: int):
         x = self.hours[k]
         for v in (self.vA, self.vB, self.vC):
             v.set_xdata([x, x])
+
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        self.axA.draw_artist(self.line_tin)
+        self.axA.draw_artist(self.txt_violation)
+        for ax, v in ((self.axA, self.vA), (self.axB, self.vB), (self.axC, self.vC)):
+            ax.draw_artist(v)
+
+    def _blit(self):
+        if self._bg is None:   # not drawn yet; _on_draw will paint the artists
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
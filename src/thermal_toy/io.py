@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import os
+import copy
+import importlib.util
 import math
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
 
 import numpy as np
@@ -15,6 +18,10 @@ try:
 except Exception as e:  # pragma: no cover
     yaml = None
 
+# Optional multi-threaded CSV parser. Only probed for here, not imported:
+# pandas imports pyarrow itself on the first parse that uses it.
+_CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+
 from .dynamics import ThermalParams
 from .reward import RewardParams
 
@@ -22,15 +29,30 @@ from .reward import RewardParams
 # -------------------------
 # Reproducible seeding
 # -------------------------
+# torch is optional and slow to import, so it is looked up on the first seeding
+# call (not at module import) and the outcome is remembered: None = unavailable.
+_TORCH_UNRESOLVED = object()
+_torch = _TORCH_UNRESOLVED
+
+
+def _optional_torch():
+    global _torch
+    if _torch is _TORCH_UNRESOLVED:
+        try:
+            import torch  # type: ignore
+            _torch = torch
+        except Exception:
+            _torch = None
+    return _torch
+
+
 def set_global_seed(seed: Optional[int]) -> None:
     """Seed python, numpy for reproducibility (torch/others can be seeded elsewhere)."""
     if seed is None:
         return
-    try:
-        import torch  # optional
+    torch = _optional_torch()
+    if torch is not None:
         torch.manual_seed(seed)  # type: ignore[attr-defined]
-    except Exception:
-        pass
     random.seed(seed)
     np.random.seed(seed)
 
@@ -58,11 +80,26 @@ class Scenario:
 # Config & CSV loading
 # -------------------------
 def load_config_yaml(path: str) -> Dict:
-    """Load YAML config into a plain dict."""
+    """
+    Load YAML config into a plain dict.
+
+    Like the day CSVs, parsed configs are cached per (path, mtime); each call
+    returns its own deep copy.
+    """
+    return copy.deepcopy(_shared_config_yaml(path))
+
+
+def _shared_config_yaml(path: str) -> Dict:
+    """The cached dict itself (no copy) for internal read-only callers."""
     if yaml is None:
         raise ImportError(
             "PyYAML is required to read YAML config. Install with `pip install pyyaml`."
         )
+    return _load_config_yaml_cached(os.path.abspath(path), os.path.getmtime(path))
+
+
+@lru_cache(maxsize=8)
+def _load_config_yaml_cached(path: str, mtime: float) -> Dict:
     with open(path, "r", encoding="utf-8") as f:
         cfg = yaml.safe_load(f)
     if not isinstance(cfg, dict):
@@ -115,6 +152,16 @@ def build_params_from_config(cfg: Dict) -> Tuple[ThermalParams, RewardParams, Di
     return thermal, reward, comfort
 
 
+# Parsed straight to the final dtypes (no post-hoc coercion pass per column).
+# The series are float32 end to end, matching the Scenario arrays.
+_DAY_CSV_DTYPES = {
+    "t": "int32",
+    "dt_h": "float64",
+    "t_out_c": "float32",
+    "price_eur_per_kwh": "float32",
+}
+
+
 def load_day_csv(path: str) -> pd.DataFrame:
     """
     Load a day CSV with columns:
@@ -122,20 +169,31 @@ def load_day_csv(path: str) -> pd.DataFrame:
       - dt_h (float)
       - t_out_c (float, °C)
       - price_eur_per_kwh (float, €/kWh)
+
+    Parsed frames are cached per (path, mtime), so repeated scenario builds
+    skip the parse until the file changes; each call returns its own copy.
     """
+    return _shared_day_csv(path).copy()
+
+
+def _shared_day_csv(path: str) -> pd.DataFrame:
+    """The cached frame itself (no copy) for internal read-only callers."""
     if not os.path.exists(path):
         raise FileNotFoundError(f"CSV not found: {path}")
-    df = pd.read_csv(path)
+    return _load_day_csv_cached(os.path.abspath(path), os.path.getmtime(path))
+
+
+@lru_cache(maxsize=8)
+def _load_day_csv_cached(path: str, mtime: float) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype=_DAY_CSV_DTYPES, engine=_CSV_ENGINE)
     required = ["t", "dt_h", "t_out_c", "price_eur_per_kwh"]
     missing = [c for c in required if c not in df.columns]
     if missing:
         raise ValueError(f"CSV {path} missing columns: {missing}")
 
-    # Basic type coercion & sorting by t
-    df = df.sort_values("t").reset_index(drop=True)
-    df["t"] = df["t"].astype(int)
-    for col in ["dt_h", "t_out_c", "price_eur_per_kwh"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce").astype(float)
+    # Files are written in order; only pay for a sorted copy when they aren't.
+    if not df["t"].is_monotonic_increasing:
+        df = df.sort_values("t", ignore_index=True)
 
     if df["t"].iloc[0] != 0:
         raise ValueError("Time index must start at t=0.")
@@ -159,9 +217,9 @@ def build_scenario(
     If enforce_horizon is True and `horizon_steps` is present in config,
     the CSV will be cropped to that length (or raise if shorter).
     """
-    cfg = load_config_yaml(config_yaml_path)
+    cfg = _shared_config_yaml(config_yaml_path)  # read-only below
     thermal, reward, comfort = build_params_from_config(cfg)
-    df = load_day_csv(day_csv_path)
+    df = _shared_day_csv(day_csv_path)   # read-only below: columns go to fresh arrays
 
     # Enforce/derive horizon
     T_csv = int(df.shape[0])
@@ -172,14 +230,16 @@ def build_scenario(
                 f"CSV has only {T_csv} rows but horizon_steps={T_cfg}. Add more rows."
             )
         if T_csv > T_cfg:
-            df = df.iloc[:T_cfg].copy()
+            df = df.iloc[:T_cfg]
             T_csv = T_cfg
 
     scenario = Scenario(
-        t=df["t"].to_numpy(dtype=np.int32),
+        # copy=True: the cached frame already holds these dtypes, so a plain
+        # to_numpy() would hand out views of the shared cache.
+        t=df["t"].to_numpy(dtype=np.int32, copy=True),
         dt_h=float(df["dt_h"].iloc[0]),
-        t_out_c=df["t_out_c"].to_numpy(dtype=np.float32),
-        price_eur_per_kwh=df["price_eur_per_kwh"].to_numpy(dtype=np.float32),
+        t_out_c=df["t_out_c"].to_numpy(dtype=np.float32, copy=True),
+        price_eur_per_kwh=df["price_eur_per_kwh"].to_numpy(dtype=np.float32, copy=True),
         T_in0_c=float(comfort["T_in0_c"]),
         T_set_c=float(comfort["T_set_c"]),
         comfort_width_c=float(comfort["comfort_width_c"]),
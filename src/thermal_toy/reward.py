@@ -1,13 +1,16 @@
 # src/thermal_toy/reward.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, NamedTuple, Optional, Tuple
 import numpy as np
 
+try:
+    from numba import guvectorize, njit, vectorize  # type: ignore  # optional JIT for reward math
+except Exception:  # pragma: no cover
+    guvectorize = njit = vectorize = None
 
-@dataclass(frozen=True)
-class RewardParams:
+
+class RewardParams(NamedTuple):
     """
     Reward/cost parameters and constants.
 
@@ -17,6 +20,9 @@ class RewardParams:
       - Energy: kWh
       - lambda_temp_eur_per_degCh: €/ (°C · h)
       - dt_h: hours per step
+
+    A NamedTuple rather than a dataclass: immutable the same way, cheaper
+    field reads, and numba can take it as a plain tuple.
     """
     lambda_temp_eur_per_degCh: float = 2.0
     dt_h: float = 0.25
@@ -48,6 +54,30 @@ def comfort_slacks(
     return s_below, s_above, L, U
 
 
+def _slack_sum(t_in, t_set, width):
+    return max(0.0, abs(t_in - t_set) - 0.5 * width)
+
+
+# True ufunc when numba is installed; "cpu" target, since horizons are far too
+# short for the parallel target's threading overhead to pay off.
+_slack_sum_uf = (
+    vectorize(["float32(float32, float32, float32)", "float64(float64, float64, float64)"],
+              target="cpu", cache=True)(_slack_sum)
+    if vectorize is not None else None
+)
+
+
+def comfort_slacks_vec(t_in_c, t_set_c, width_c) -> np.ndarray:
+    """
+    Elementwise s_below + s_above for arrays of indoor temperatures (e.g. many
+    candidate trajectories at once); broadcasts like any ufunc.
+    """
+    if _slack_sum_uf is not None:
+        return _slack_sum_uf(t_in_c, t_set_c, width_c)
+    t_in = np.asarray(t_in_c)
+    return np.maximum(np.abs(t_in - t_set_c) - 0.5 * width_c, 0.0)
+
+
 def step_cost_eur(price_eur_per_kwh: float, elec_energy_kwh: float) -> float:
     """
     Energy cost for this step in euros.
@@ -55,6 +85,34 @@ def step_cost_eur(price_eur_per_kwh: float, elec_energy_kwh: float) -> float:
     return float(price_eur_per_kwh) * float(elec_energy_kwh)
 
 
+def _step_reward_loop(t_in, t_set, width, price, e_kwh, lam, dt_h):
+    half = 0.5 * width
+    L = t_set - half
+    U = t_set + half
+    s_below = max(0.0, L - t_in)
+    s_above = max(0.0, t_in - U)
+    energy_cost = price * e_kwh
+    comfort_pen = lam * (s_below + s_above) * dt_h
+    obj = energy_cost + comfort_pen
+    return -obj, s_below, s_above, L, U, energy_cost, comfort_pen, obj
+
+
+# Float-only core of `step_reward`; RL loops can call it directly to skip the
+# info dict. Compiled when numba is installed (no fastmath, so the compiled and
+# pure-Python paths agree bit for bit).
+_step_reward_core = njit(cache=True)(_step_reward_loop) if njit is not None else _step_reward_loop
+
+
+def warmup() -> None:
+    """
+    Compile (or load from numba's cache) the per-step reward kernel now rather
+    than on the first step. Cheap no-op without numba; env/engine
+    constructors call it, plain imports do not.
+    """
+    if njit is not None:
+        _step_reward_core(21.0, 21.0, 2.0, 0.0, 0.0, 2.0, 0.25)
+
+
 def step_reward(
     t_in_c: float,
     t_set_c: float,
@@ -71,12 +129,19 @@ def step_reward(
 
     Reward for RL:
         r_t = -J_t
+
+    Passing `t_in_c` as an ndarray (e.g. one entry per env of a vector env)
+    evaluates the whole batch in one call; the reward and the info values
+    then come back as arrays, except the band bounds, which stay scalars.
     """
-    s_below, s_above, L, U = comfort_slacks(t_in_c, t_set_c, comfort_width_c)
-    energy_cost = step_cost_eur(price_eur_per_kwh, elec_energy_kwh)
-    comfort_penalty = params.lambda_temp_eur_per_degCh * (s_below + s_above) * params.dt_h
-    obj_step = energy_cost + comfort_penalty
-    reward = -obj_step
+    if isinstance(t_in_c, np.ndarray) and t_in_c.ndim:
+        return _step_reward_batched(t_in_c, t_set_c, comfort_width_c,
+                                    price_eur_per_kwh, elec_energy_kwh, params)
+    reward, s_below, s_above, L, U, energy_cost, comfort_penalty, obj_step = _step_reward_core(
+        float(t_in_c), float(t_set_c), float(comfort_width_c),
+        float(price_eur_per_kwh), float(elec_energy_kwh),
+        float(params.lambda_temp_eur_per_degCh), float(params.dt_h),
+    )
 
     info = {
         "comfort_L_c": L,
@@ -92,6 +157,16 @@ def step_reward(
 
 # -------- Vectorized helpers (optional) --------
 
+_ROLLOUT_KEYS = (
+    "energy_cost_eur",
+    "s_temp_below_c",
+    "s_temp_above_c",
+    "comfort_penalty_eur",
+    "objective_eur",
+    "reward",
+)
+
+
 def rollout_costs_and_penalties(
     T_in_c: np.ndarray,
     T_set_c: float,
@@ -99,9 +174,13 @@ def rollout_costs_and_penalties(
     price_eur_per_kwh: np.ndarray,
     elec_energy_kwh: np.ndarray,
     params: RewardParams,
+    *,
+    dtype=np.float32,
+    out: Optional[Dict[str, np.ndarray]] = None,
 ) -> Dict[str, np.ndarray]:
     """
-    Vectorized computation over a full horizon.
+    Vectorized computation over a full horizon (float32 unless `dtype` says
+    otherwise; float64 matches `step_reward` to rounding).
 
     Returns dict with arrays:
       - energy_cost_eur
@@ -109,36 +188,124 @@ def rollout_costs_and_penalties(
       - comfort_penalty_eur
       - objective_eur
       - reward
+
+    Pass a previous result as `out` to overwrite its arrays in place instead
+    of allocating six new ones (repeated rollouts over the same horizon).
     """
-    T_in = np.asarray(T_in_c, dtype=np.float32)
-    price = np.asarray(price_eur_per_kwh, dtype=np.float32)
-    e_kwh = np.asarray(elec_energy_kwh, dtype=np.float32)
+    T_in = np.asarray(T_in_c, dtype=dtype)
+    price = np.asarray(price_eur_per_kwh, dtype=dtype)
+    e_kwh = np.asarray(elec_energy_kwh, dtype=dtype)
     assert T_in.shape == price.shape == e_kwh.shape, "All series must align"
+    if out is None:
+        out = {name: np.empty(T_in.shape, dtype=T_in.dtype) for name in _ROLLOUT_KEYS}
+    else:
+        assert all(out[n].shape == T_in.shape and out[n].dtype == T_in.dtype for n in _ROLLOUT_KEYS), \
+            "`out` arrays must match the inputs' shape and dtype"
+    energy_cost, s_below, s_above, comfort_pen, obj, rew = (out[n] for n in _ROLLOUT_KEYS)
 
-    L, U = comfort_band(T_set_c, comfort_width_c)
-    s_below = np.maximum(0.0, L - T_in)
-    s_above = np.maximum(0.0, T_in - U)
+    # max(0, L - T) + max(0, T - U) == max(0, |T - T_set| - half), built in the
+    # penalty buffer; every step below writes through out= into `out`.
+    t_set = T_in.dtype.type(T_set_c)
+    half = T_in.dtype.type(0.5 * float(comfort_width_c))
+    slack = comfort_pen
+    np.subtract(T_in, t_set, out=slack)
+    np.abs(slack, out=slack)
+    np.subtract(slack, half, out=slack)
+    np.maximum(slack, 0.0, out=slack)
+    s_below.fill(0.0)
+    np.copyto(s_below, slack, where=T_in < t_set)
+    np.subtract(slack, s_below, out=s_above)
 
-    energy_cost = price * e_kwh
-    comfort_pen = params.lambda_temp_eur_per_degCh * (s_below + s_above) * params.dt_h
-    obj = energy_cost + comfort_pen
-    rew = -obj
-
-    return {
-        "energy_cost_eur": energy_cost.astype(np.float32),
-        "s_temp_below_c": s_below.astype(np.float32),
-        "s_temp_above_c": s_above.astype(np.float32),
-        "comfort_penalty_eur": comfort_pen.astype(np.float32),
-        "objective_eur": obj.astype(np.float32),
-        "reward": rew.astype(np.float32),
+    k = T_in.dtype.type(params.lambda_temp_eur_per_degCh * params.dt_h)
+    np.multiply(price, e_kwh, out=energy_cost)
+    np.multiply(slack, k, out=comfort_pen)
+    np.add(energy_cost, comfort_pen, out=obj)
+    np.negative(obj, out=rew)
+    return out
+
+
+def _step_reward_batched(t_in_c, t_set_c, comfort_width_c, price_eur_per_kwh,
+                         elec_energy_kwh, params):
+    """ndarray branch of `step_reward`; price/energy may be scalars or arrays."""
+    dtype = np.float32 if t_in_c.dtype == np.float32 else np.float64
+    T_in, price, e_kwh = np.broadcast_arrays(
+        t_in_c, np.asarray(price_eur_per_kwh, dtype=dtype), np.asarray(elec_energy_kwh, dtype=dtype)
+    )
+    r = rollout_costs_and_penalties(T_in, t_set_c, comfort_width_c, price, e_kwh, params, dtype=dtype)
+    L, U = comfort_band(t_set_c, comfort_width_c)
+    info = {
+        "comfort_L_c": L,
+        "comfort_U_c": U,
+        "s_temp_below_c": r["s_temp_below_c"],
+        "s_temp_above_c": r["s_temp_above_c"],
+        "cost_eur_step": r["energy_cost_eur"],
+        "comfort_penalty_eur_step": r["comfort_penalty_eur"],
+        "objective_eur_step": r["objective_eur"],
     }
+    return r["reward"], info
+
+
+def _reward_rows(Tin, t_set, half, price, e_kwh, k, out):
+    # No float literals: everything stays in the dtype of the inputs.
+    for i in range(Tin.shape[0]):
+        d = abs(Tin[i] - t_set)
+        if d > half:
+            out[i] = -(price[i] * e_kwh[i] + k * (d - half))
+        else:
+            out[i] = -(price[i] * e_kwh[i])
+
+
+# Gufunc over the last (time) axis; numba spreads the leading batch axes
+# across threads. None without numba.
+_reward_gu = (
+    guvectorize(
+        ["void(float32[:], float32, float32, float32[:], float32[:], float32, float32[:])",
+         "void(float64[:], float64, float64, float64[:], float64[:], float64, float64[:])"],
+        "(t),(),(),(t),(t),()->(t)",
+        target="parallel",
+        cache=True,
+    )(_reward_rows)
+    if guvectorize is not None else None
+)
+
+
+def batch_rewards(
+    T_in_c: np.ndarray,
+    T_set_c: float,
+    comfort_width_c: float,
+    price_eur_per_kwh: np.ndarray,
+    elec_energy_kwh: np.ndarray,
+    params: RewardParams,
+) -> np.ndarray:
+    """
+    Reward array for a batch of trajectories, e.g. M candidate rollouts of
+    shape (M, T). Price/energy broadcast against it, so (T,) works for a
+    shared price curve. float32 in, float32 out; anything else is float64.
+    """
+    T_in = np.asarray(T_in_c)
+    dtype = np.float32 if T_in.dtype == np.float32 else np.float64
+    T_in = T_in.astype(dtype, copy=False)
+    price = np.asarray(price_eur_per_kwh, dtype=dtype)
+    e_kwh = np.asarray(elec_energy_kwh, dtype=dtype)
+    # Scalars cast up front so a float32 batch never meets a float64 operand
+    # (and the gufunc always resolves to the float32 loop).
+    t_set = dtype(T_set_c)
+    half = dtype(0.5 * float(comfort_width_c))
+    k = dtype(params.lambda_temp_eur_per_degCh * params.dt_h)
+    if _reward_gu is not None:
+        return _reward_gu(T_in, t_set, half, price, e_kwh, k)
+    slack = np.maximum(np.abs(T_in - t_set) - half, dtype(0))
+    return -(price * e_kwh + k * slack)
 
 
 __all__ = [
     "RewardParams",
     "comfort_band",
     "comfort_slacks",
+    "comfort_slacks_vec",
     "step_cost_eur",
     "step_reward",
+    "warmup",
     "rollout_costs_and_penalties",
+    "batch_rewards",
 ]
@@ -1,10 +1,9 @@
-from __future__ import annotations
-
 """
 Re-export session types so callers can do:
 
     from thermal_toy.runtime import DummySession, GameSession
 """
+from __future__ import annotations
 
 try:
     from .session import DummySession, GameSession  # type: ignore F401
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
+try:
+    from ..engine.types import Action as _Action  # type: ignore
+except Exception:  # pragma: no cover - GameSession degrades to the fallback
+    _Action = None
+
 # ------------------------------
 # Legacy dummy session (kept)
 # ------------------------------
@@ -35,6 +41,9 @@ class GameSession:
     """
     Thin adapter so GUI can call .reset/.step with a dict, like DummySession did,
     but backed by the real Engine (indoor thermal balance + HVAC sizing).
+
+    reset()/step() return the same dict object every tick, refilled in place;
+    copy it (as the GUI does) if you need to keep a snapshot.
     """
     def __init__(
         self,
@@ -47,6 +56,8 @@ class GameSession:
         self._engine = None
         self._fallback = DummySession()
         self._init_error: Optional[str] = None
+        self._out: Dict[str, Any] = {}
+        self._action = _Action() if _Action is not None else None
 
         try:
             from ..engine.engine import Engine  # type: ignore
@@ -69,23 +80,28 @@ class GameSession:
         tick = self._engine.reset()
         return self._flatten(tick)
 
-    def step(self, action: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    def step(self, action: Dict[str, Any] | float | None = None) -> Dict[str, Any]:
+        """`action` is {"u": ...}, a bare number for u, or None for u=0."""
         if self._engine is None:
             return self._fallback.step(action)
-        from ..engine.types import Action  # local import keeps this module lightweight
-        u = float(action.get("u", 0.0)) if action else 0.0
-        tick = self._engine.step(Action(hvac_u=u))
+        act = self._action
+        if action is None:
+            act.hvac_u = 0.0
+        elif isinstance(action, Mapping):
+            act.hvac_u = float(action.get("u", 0.0))
+        else:
+            act.hvac_u = float(action)
+        tick = self._engine.step(act)
         return self._flatten(tick)
 
-    @staticmethod
-    def _flatten(tick) -> Dict[str, Any]:
-        d = dict(tick.info)
-        d.update({
-            "reward": float(tick.reward),
-            "hour": float(tick.obs.hour_frac),
-            "terminated": bool(tick.terminated),
-            "truncated": bool(tick.truncated),
-        })
+    def _flatten(self, tick) -> Dict[str, Any]:
+        d = self._out
+        d.clear()
+        d.update(tick.info)
+        d["reward"] = float(tick.reward)
+        d["hour"] = float(tick.obs.hour_frac)
+        d["terminated"] = bool(tick.terminated)
+        d["truncated"] = bool(tick.truncated)
         return d
 
 __all__ = ["DummySession", "GameSession"]
@@ -2,15 +2,23 @@
 from __future__ import annotations
 
 import os
+import sys
 import argparse
-from typing import Optional, List, Dict
 
 import numpy as np
 import pandas as pd
 
 from .io import build_scenario, load_config_yaml
-from .dynamics import step_temp
-from .reward import step_reward, RewardParams
+from .dynamics import rollout_temp
+from .reward import rollout_costs_and_penalties, RewardParams
+
+
+# Per-step HUD line; formatted only when the HUD is on and flushed in batches.
+_HUD_FMT = (
+    "t={:02d} Tin={:5.2f}°C Tout={:5.2f}°C a={:.2f} P={:.2f}kW "
+    "price={:.3f}€/kWh cost={:.3f}€ pen={:.3f}€ J={:.3f}€\n"
+)
+_HUD_FLUSH_LINES = 64
 
 
 def run_simulation(
@@ -19,10 +27,12 @@ def run_simulation(
     *,
     action_frac: float = 0.5,
     ansi: bool = True,
+    hud_stride: int = 1,
 ) -> pd.DataFrame:
     """
-    Iterate once over the CSV horizon and apply a constant heater action.
-    Returns a DataFrame with per-step diagnostics.
+    Roll a constant heater action over the CSV horizon in one vectorized pass.
+    Returns a DataFrame with per-step diagnostics; with `ansi`, every
+    `hud_stride`-th step is echoed to stdout.
     """
     scenario, th_params, rw_params = build_scenario(
         config_yaml_path, day_csv_path, enforce_horizon=True
@@ -30,63 +40,60 @@ def run_simulation(
 
     a = float(np.clip(action_frac, 0.0, 1.0))
     T = scenario.T
-    Tin = float(scenario.T_in0_c)
-
-    rows: List[Dict] = []
-    cum_cost = 0.0
-    cum_pen = 0.0
-    for k in range(T):
-        Tout = float(scenario.t_out_c[k])
-        price = float(scenario.price_eur_per_kwh[k])
-
-        Tin_next, dyn = step_temp(
-            T_in_c=Tin, T_out_c=Tout, action_frac=a, params=th_params
-        )
-
-        r, info_r = step_reward(
-            t_in_c=Tin_next,
-            t_set_c=scenario.T_set_c,
-            comfort_width_c=scenario.comfort_width_c,
-            price_eur_per_kwh=price,
-            elec_energy_kwh=dyn["elec_energy_kwh"],
-            params=rw_params if isinstance(rw_params, RewardParams) else RewardParams(),
-        )
-
-        cum_cost += info_r["cost_eur_step"]
-        cum_pen += info_r["comfort_penalty_eur_step"]
-
-        row = {
-            "t": k,
-            "dt_h": scenario.dt_h,
-            "action_frac": a,
-            "Tin_c": Tin_next,
-            "Tout_c": Tout,
-            "price_eur_per_kwh": price,
-            "elec_power_kw": dyn["elec_power_kw"],
-            "elec_energy_kwh": dyn["elec_energy_kwh"],
-            "q_loss_kw": dyn["q_loss_kw"],
-            "q_heat_kw": dyn["q_heat_kw"],
-            "cost_eur_step": info_r["cost_eur_step"],
-            "comfort_penalty_eur_step": info_r["comfort_penalty_eur_step"],
-            "objective_eur_step": info_r["objective_eur_step"],
-            "cum_energy_cost_eur": cum_cost,
-            "cum_comfort_penalty_eur": cum_pen,
-        }
-        rows.append(row)
-
-        if ansi:
-            print(
-                f"t={k:02d} Tin={Tin_next:5.2f}°C Tout={Tout:5.2f}°C "
-                f"a={a:.2f} P={dyn['elec_power_kw']:.2f}kW "
-                f"price={price:.3f}€/kWh "
-                f"cost={info_r['cost_eur_step']:.3f}€ "
-                f"pen={info_r['comfort_penalty_eur_step']:.3f}€ "
-                f"J={info_r['objective_eur_step']:.3f}€"
-            )
-
-        Tin = Tin_next
-
-    return pd.DataFrame(rows)
+    Tout = scenario.t_out_c.astype(np.float64)
+    price = scenario.price_eur_per_kwh.astype(np.float64)
+
+    # Only the clipped Tin recurrence is sequential; the rest is elementwise.
+    Tin, dyn = rollout_temp(scenario.T_in0_c, Tout, a, th_params)
+    rw = rollout_costs_and_penalties(
+        Tin,
+        scenario.T_set_c,
+        scenario.comfort_width_c,
+        price,
+        dyn["elec_energy_kwh"],
+        rw_params if isinstance(rw_params, RewardParams) else RewardParams(),
+        dtype=np.float64,
+    )
+
+    # Every column is already a typed, freshly allocated array: hand them to
+    # pandas as-is (copy=False) instead of letting it infer and re-copy.
+    cols = {
+        "t": np.arange(T, dtype=np.int32),
+        "dt_h": np.full(T, float(scenario.dt_h)),
+        "action_frac": np.full(T, a),
+        "Tin_c": Tin,
+        "Tout_c": Tout,
+        "price_eur_per_kwh": price,
+        "elec_power_kw": dyn["elec_power_kw"],
+        "elec_energy_kwh": dyn["elec_energy_kwh"],
+        "q_loss_kw": dyn["q_loss_kw"],
+        "q_heat_kw": dyn["q_heat_kw"],
+        "cost_eur_step": rw["energy_cost_eur"],
+        "comfort_penalty_eur_step": rw["comfort_penalty_eur"],
+        "objective_eur_step": rw["objective_eur"],
+        "cum_energy_cost_eur": np.cumsum(rw["energy_cost_eur"]),
+        "cum_comfort_penalty_eur": np.cumsum(rw["comfort_penalty_eur"]),
+    }
+    df = pd.DataFrame(cols, copy=False)
+
+    if ansi:
+        stride = max(1, int(hud_stride))
+        buf = []
+        for k, (tin, tout, p_kw, pr, cost, pen, obj) in enumerate(zip(
+            Tin.tolist(), Tout.tolist(), dyn["elec_power_kw"].tolist(), price.tolist(),
+            rw["energy_cost_eur"].tolist(), rw["comfort_penalty_eur"].tolist(),
+            rw["objective_eur"].tolist(),
+        )):
+            if k % stride:
+                continue
+            buf.append(_HUD_FMT.format(k, tin, tout, a, p_kw, pr, cost, pen, obj))
+            if len(buf) >= _HUD_FLUSH_LINES:
+                sys.stdout.write("".join(buf))
+                buf.clear()
+        if buf:
+            sys.stdout.write("".join(buf))
+
+    return df
 
 
 def main():
@@ -98,6 +105,7 @@ def main():
     parser.add_argument("--action", type=float, default=0.5, help="Heater fraction in [0,1]")
     parser.add_argument("--outdir", type=str, default="outputs")
     parser.add_argument("--no-ansi", action="store_true", help="Do not print per-step HUD")
+    parser.add_argument("--hud-stride", type=int, default=1, help="Print every Nth HUD line")
     args = parser.parse_args()
 
     os.makedirs(args.outdir, exist_ok=True)
@@ -106,6 +114,7 @@ def main():
         day_csv_path=args.csv,
         action_frac=args.action,
         ansi=not args.no_ansi,
+        hud_stride=args.hud_stride,
     )
 
     out_csv = os.path.join(args.outdir, "rollout_simulation.csv")
@@ -0,0 +1,78 @@
+# tests/test_reward.py
+import numpy as np
+import pytest
+
+from thermal_toy import reward
+from thermal_toy.reward import RewardParams, batch_rewards, rollout_costs_and_penalties, step_reward
+
+T_SET, WIDTH = 21.0, 2.0
+PARAMS = RewardParams(lambda_temp_eur_per_degCh=2.0, dt_h=0.25)
+
+
+def _batch(dtype):
+    rng = np.random.default_rng(0)
+    t_in = rng.uniform(12.0, 30.0, size=(8, 96)).astype(dtype)
+    price = rng.uniform(0.0, 0.6, size=96).astype(dtype)
+    e_kwh = rng.uniform(0.0, 0.75, size=96).astype(dtype)
+    return t_in, price, e_kwh
+
+
+def _step_loop(t_in, price, e_kwh):
+    out = np.empty(t_in.shape)
+    for m, t in np.ndindex(t_in.shape):
+        out[m, t] = step_reward(
+            float(t_in[m, t]), T_SET, WIDTH, float(price[t]), float(e_kwh[t]), PARAMS
+        )[0]
+    return out
+
+
+def _check_against_loop(dtype, rtol, atol):
+    t_in, price, e_kwh = _batch(dtype)
+    got = batch_rewards(t_in, T_SET, WIDTH, price, e_kwh, PARAMS)
+    assert got.dtype == dtype and got.shape == t_in.shape
+    np.testing.assert_allclose(got, _step_loop(t_in, price, e_kwh), rtol=rtol, atol=atol)
+
+
+@pytest.mark.skipif(reward._reward_gu is None, reason="numba not installed")
+@pytest.mark.parametrize("dtype,rtol,atol", [(np.float64, 1e-12, 1e-12), (np.float32, 1e-5, 1e-6)])
+def test_batch_rewards_gufunc_matches_step_reward(dtype, rtol, atol):
+    _check_against_loop(dtype, rtol, atol)
+
+
+@pytest.mark.parametrize("dtype,rtol,atol", [(np.float64, 1e-12, 1e-12), (np.float32, 1e-5, 1e-6)])
+def test_batch_rewards_numpy_matches_step_reward(monkeypatch, dtype, rtol, atol):
+    monkeypatch.setattr(reward, "_reward_gu", None)
+    _check_against_loop(dtype, rtol, atol)
+
+
+@pytest.mark.skipif(reward._reward_gu is None, reason="numba not installed")
+def test_batch_rewards_gufunc_matches_numpy_float32(monkeypatch):
+    t_in, price, e_kwh = _batch(np.float32)
+    fast = batch_rewards(t_in, T_SET, WIDTH, price, e_kwh, PARAMS)
+    monkeypatch.setattr(reward, "_reward_gu", None)
+    slow = batch_rewards(t_in, T_SET, WIDTH, price, e_kwh, PARAMS)
+    np.testing.assert_array_equal(fast, slow)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_rollout_costs_and_penalties_keeps_dtype(dtype):
+    t_in, price, e_kwh = _batch(np.float32)
+    t_in = t_in[0]  # one (T,) trajectory, float32 inputs throughout
+    kwargs = {} if dtype is np.float32 else {"dtype": np.float64}
+    out = rollout_costs_and_penalties(t_in, T_SET, WIDTH, price, e_kwh, PARAMS, **kwargs)
+    assert out["energy_cost_eur"].dtype == dtype
+    for name, arr in out.items():
+        assert arr.dtype == dtype, name
+        assert arr.shape == t_in.shape, name
+
+
+def test_rollout_costs_and_penalties_reuses_out():
+    t_in, price, e_kwh = _batch(np.float32)
+    first = rollout_costs_and_penalties(t_in[0], T_SET, WIDTH, price, e_kwh, PARAMS)
+    expected = rollout_costs_and_penalties(t_in[1], T_SET, WIDTH, price, e_kwh, PARAMS)
+    buffers = {name: arr for name, arr in first.items()}
+    again = rollout_costs_and_penalties(t_in[1], T_SET, WIDTH, price, e_kwh, PARAMS, out=first)
+    assert again is first
+    for name, arr in again.items():
+        assert arr is buffers[name], name
+        np.testing.assert_array_equal(arr, expected[name], err_msg=name)
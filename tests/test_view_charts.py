@@ -0,0 +1,23 @@
+# tests/test_view_charts.py
+import numpy as np
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from thermal_toy.gui import view_charts  # noqa: E402
+
+L, U = 20.0, 22.0
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [view_charts.comfort_violation, view_charts._comfort_violation_np],
+    ids=["dispatch", "numpy"],
+)
+def test_comfort_violation_treats_nan_as_zero(fn):
+    tin = np.full(16, np.nan)
+    tin[:6] = [19.0, np.nan, 23.5, 21.0, np.nan, 18.0]
+    # 1.0 below + 1.5 above + 2.0 below; NaNs (and the NaN tail past n) add nothing.
+    assert fn(tin, L, U, 6) == pytest.approx(4.5)
+    assert fn(tin, L, U, 16) == pytest.approx(4.5)
+    assert fn(np.full(8, np.nan), L, U, 8) == 0.0